@@ -1,19 +1,26 @@
 """
 Screenshot capture script — generates docs/screenshots/light_mode.png and dark_mode.png.
 Run once with: python capture_screenshots.py
+
+Uses ``mss`` to copy the presented framebuffer when it is installed and falls
+back to ``QWidget.grab()`` otherwise.
 """
 import sys
 import os
 
+try:
+    import mss
+    import mss.tools
+except ImportError:
+    mss = None
+
 # Ensure project root is on path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QScreen
+from PyQt6.QtCore import QTimer, pyqtSignal
 
 from gui.main_window import MainWindow
-from gui.styles import GLOBAL_STYLESHEET
 
 SAVE_DIR = os.path.join(os.path.dirname(__file__), "docs", "screenshots")
 os.makedirs(SAVE_DIR, exist_ok=True)
@@ -21,36 +28,72 @@ os.makedirs(SAVE_DIR, exist_ok=True)
 app = QApplication(sys.argv)
 app.setApplicationName("CSE Stock Analyzer")
 app.setStyle("Fusion")
-app.setStyleSheet(GLOBAL_STYLESHEET)
 
-window = MainWindow()
+
+class CaptureWindow(MainWindow):
+    """MainWindow that signals once its first frame has been painted."""
+
+    ready = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._painted_once = False
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted_once:
+            self._painted_once = True
+            # Let the rest of the frame finish before capturing
+            QTimer.singleShot(0, self.ready.emit)
+
+
+window = CaptureWindow()
 window.resize(1280, 800)
 window.show()
 
 step = [0]  # mutable counter for closure
 
+# One grabber for the whole run; opening it allocates OS capture resources
+if mss is not None and sys.platform == "win32":
+    import mss.windows
+    mss.windows.CAPTUREBLT = 0
+sct = mss.mss() if mss is not None else None
+
+
+def save_window(path):
+    if sct is None:
+        window.grab().save(path)
+        return
+    # mss works in physical pixels, Qt geometry is in logical pixels
+    g = window.geometry()
+    dpr = window.devicePixelRatioF()
+    rect = {"top": round(g.top() * dpr), "left": round(g.left() * dpr),
+            "width": round(g.width() * dpr), "height": round(g.height() * dpr)}
+    shot = sct.grab(rect)
+    mss.tools.to_png(shot.rgb, shot.size, output=path)
+
 
 def capture():
     if step[0] == 0:
         # Light mode — already the default
-        pixmap = window.grab()
         path = os.path.join(SAVE_DIR, "light_mode.png")
-        pixmap.save(path)
+        save_window(path)
         print(f"Saved: {path}")
-        # Switch to dark mode
+        # Switch to dark mode and capture once the restyle events drain
         window.apply_theme(True)
         step[0] = 1
-        QTimer.singleShot(400, capture)
+        QApplication.processEvents()
+        QApplication.sendPostedEvents()
+        QTimer.singleShot(0, capture)
 
     elif step[0] == 1:
-        pixmap = window.grab()
         path = os.path.join(SAVE_DIR, "dark_mode.png")
-        pixmap.save(path)
+        save_window(path)
         print(f"Saved: {path}")
         print("Done.")
         app.quit()
 
 
-# Wait for the window to fully render before capturing
-QTimer.singleShot(600, capture)
+# Capture as soon as the window has actually rendered
+window.ready.connect(capture)
 sys.exit(app.exec())
@@ -2,45 +2,148 @@
 Main window for CSE Stock Analyzer GUI application.
 """
 
+import functools
+import importlib
+import os
+
 from PyQt6.QtWidgets import (
     QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout,
     QToolBar, QStatusBar, QMessageBox, QLabel, QApplication, QFileDialog
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction, QColor, QPalette
-
-import qtawesome as qta
-
-try:
-    import qdarktheme
-except Exception:
-    qdarktheme = None
-
-from gui.tabs.breakeven_tab import BreakEvenTab
-from gui.tabs.fees_tab import FeesTab
-from gui.tabs.fundamental_tab import FundamentalTab
-from gui.tabs.technical_tab import TechnicalTab
-from gui.tabs.complete_analysis_tab import CompleteAnalysisTab
-from gui.tabs.history_tab import HistoryTab
-from gui.styles import GLOBAL_STYLESHEET, GLOBAL_STYLESHEET_DARK
-
-from src.export.pdf_report import generate_pdf_report
-from src.export.csv_export import export_to_csv, export_to_excel
+from PyQt6.QtCore import Qt, QSize, QEvent, QTimer
+from PyQt6.QtGui import QAction, QColor, QIcon, QPalette
+
+from gui.styles import build_stylesheet
+
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Pre-rendered icons in the default colour, written by render_icons.py
+ICON_DIR = os.path.join(os.path.dirname(__file__), "resources", "icons")
+ICON_COLOR = "#64748b"
+
+
+@functools.lru_cache(maxsize=64)
+def _icon(name: str, color: str = ICON_COLOR) -> QIcon:
+    """Return an icon, built once per (name, color) pair.
+
+    Icons in the default colour load from the bundled PNGs; anything else
+    (or a missing file) is rasterized by qtawesome. QIcon is implicitly
+    shared, so the same instance can back several actions.
+    """
+    if color == ICON_COLOR:
+        path = os.path.join(ICON_DIR, f"{name}.png")
+        if os.path.exists(path):
+            return QIcon(path)
+    # qtawesome registers its fonts on import, which needs a live QApplication
+    import qtawesome as qta
+    return qta.icon(name, color=color)
+
+
+@functools.lru_cache(maxsize=None)
+def _qdarktheme():
+    """Import qdarktheme on first dark-mode use; None when it is unavailable."""
+    try:
+        import qdarktheme
+    except Exception:
+        return None
+    return qdarktheme
+
+
+# Fusion palette used for dark mode when qdarktheme is not installed,
+# as (role, colour) pairs resolved and parsed once at import
+_DARK_ROLES = tuple(
+    (getattr(QPalette.ColorRole, role), QColor(color))
+    for role, color in (
+        ("Window", "#0f172a"),
+        ("WindowText", "#e2e4e7"),
+        ("Base", "#1e293b"),
+        ("AlternateBase", "#0f172a"),
+        ("ToolTipBase", "#1e293b"),
+        ("ToolTipText", "#e2e4e7"),
+        ("Text", "#e2e4e7"),
+        ("Button", "#1e293b"),
+        ("ButtonText", "#e2e4e7"),
+        ("BrightText", "#ffffff"),
+        ("Link", "#93c5fd"),
+        ("Highlight", "#2563eb"),
+        ("HighlightedText", "#ffffff"),
+        ("PlaceholderText", "#64748b"),
+        ("Light", "#334155"),
+        ("Midlight", "#1e293b"),
+        ("Dark", "#0f172a"),
+        ("Mid", "#334155"),
+        ("Shadow", "#000000"),
+    )
+)
+
+
+def _build_dark_palette() -> QPalette:
+    """Build the fallback dark QPalette from _DARK_ROLES."""
+    palette = QPalette()
+    for role, color in _DARK_ROLES:
+        palette.setColor(role, color)
+    return palette
+
+
+# Export handlers by file extension, as (module, function) so the exporter's
+# dependencies are only imported when that format is chosen
+_EXPORTERS = {
+    ".pdf": ("src.export.pdf_report", "generate_pdf_report"),
+    ".csv": ("src.export.csv_export", "export_to_csv"),
+    ".xlsx": ("src.export.csv_export", "export_to_excel"),
+}
+# First word of the save-dialog filter -> extension
+_FILTER_EXT = {"PDF": ".pdf", "CSV": ".csv", "Excel": ".xlsx"}
+
+
+# Text colour comes from the application stylesheet, so one body serves both themes
+_ABOUT_HTML = (
+    "<h3>CSE Stock Analyzer v1.0.0</h3>"
+    "<p>Professional stock analysis for the Colombo Stock Exchange.</p>"
+    "<p>Break-even, fees, fundamental &amp; technical analysis.</p>"
+    "<p>&copy; 2026 CSE Tools</p>"
+)
+
 
 class MainWindow(QMainWindow):
     """Main application window with tab-based interface."""
 
+    # (label, module, class name, icon) for each tab, in display order.
+    # Tab modules are imported when the tab is first shown.
+    _TABS = (
+        ("Break-Even", "gui.tabs.breakeven_tab", "BreakEvenTab", "fa5s.coins"),
+        ("Fees", "gui.tabs.fees_tab", "FeesTab", "fa5s.file-invoice"),
+        ("Fundamental", "gui.tabs.fundamental_tab", "FundamentalTab", "fa5s.chart-line"),
+        ("Technical", "gui.tabs.technical_tab", "TechnicalTab", "fa5s.chart-bar"),
+        ("Complete Analysis", "gui.tabs.complete_analysis_tab", "CompleteAnalysisTab", "fa5s.bullseye"),
+        ("History", "gui.tabs.history_tab", "HistoryTab", "fa5s.history"),
+    )
+    _TAB_INDEX = {label: index for index, (label, *_) in enumerate(_TABS)}
+    # Tabs keep their position when materialized, so this index is fixed
+    _HISTORY_INDEX = _TAB_INDEX["History"]
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("CSE Stock Analyzer")
         self.setMinimumSize(1100, 720)
         self.dark_mode = False
+        self._theme_applied = None
+        self._theme_pending = set()
+        self._about_box = None
+        # Set when a new analysis is saved; History reloads only then
+        self._history_dirty = False
+
+        # Composed stylesheets are built once; qdarktheme parses its
+        # templates on every load_stylesheet() call. The dark sheet is
+        # composed on first use so light-only sessions never load qdarktheme.
+        self._qss_light = build_stylesheet("light")
+        self._qss_dark = None
+        self._dark_palette = None
 
         self.init_ui()
+        self.create_actions()
         self.create_menus()
         self.create_toolbar()
         self.create_status_bar()
@@ -52,7 +155,7 @@ class MainWindow(QMainWindow):
 
     def init_ui(self):
         central = QWidget()
-        root = QVBoxLayout()
+        root = QVBoxLayout(central)
         root.setContentsMargins(10, 8, 10, 6)
         root.setSpacing(8)
 
@@ -61,7 +164,7 @@ class MainWindow(QMainWindow):
         header.setObjectName("HeaderBar")
         header.setFixedHeight(48)
 
-        hl = QHBoxLayout()
+        hl = QHBoxLayout(header)
         hl.setContentsMargins(14, 0, 14, 0)
         hl.setSpacing(8)
 
@@ -69,7 +172,7 @@ class MainWindow(QMainWindow):
         title.setObjectName("HeaderTitle")
 
         sep = QLabel("  |  ")
-        sep.setStyleSheet("color: rgba(255,255,255,0.4); font-size: 14px;")
+        sep.setObjectName("HeaderSep")
 
         subtitle = QLabel("Colombo Stock Exchange")
         subtitle.setObjectName("HeaderSubtitle")
@@ -82,7 +185,6 @@ class MainWindow(QMainWindow):
         badge = QLabel("v1.0.0")
         badge.setObjectName("HeaderBadge")
         hl.addWidget(badge)
-        header.setLayout(hl)
         root.addWidget(header)
 
         # tabs
@@ -91,70 +193,78 @@ class MainWindow(QMainWindow):
         self.tabs.setMovable(False)
         self.tabs.setDocumentMode(False)
 
-        self.breakeven_tab = BreakEvenTab()
-        self.fees_tab = FeesTab()
-        self.fundamental_tab = FundamentalTab()
-        self.technical_tab = TechnicalTab()
-        self.complete_tab = CompleteAnalysisTab()
-        self.history_tab = HistoryTab()
-
-        self.tabs.addTab(self.breakeven_tab, "Break-Even")
-        self.tabs.addTab(self.fees_tab, "Fees")
-        self.tabs.addTab(self.fundamental_tab, "Fundamental")
-        self.tabs.addTab(self.technical_tab, "Technical")
-        self.tabs.addTab(self.complete_tab, "Complete Analysis")
-        self.tabs.addTab(self.history_tab, "History")
-        
+        # Tabs are built on first activation; until then each index holds an
+        # empty placeholder so only the visible tab pays construction cost.
+        self._tab_factories = dict(enumerate(self._TABS))
+        self._tab_instances = {}
+        # index -> bound clear_inputs / apply_theme, captured once per tab
+        self._clear_callbacks = {}
+        self._theme_callbacks = {}
+        for label, _, _, icon in self._TABS:
+            self.tabs.addTab(QWidget(), _icon(icon), label)
+        self._materialize_tab(0)
+
         # Connect tab change signal
         self.tabs.currentChanged.connect(self.on_tab_changed)
 
         root.addWidget(self.tabs, 1)
-        central.setLayout(root)
         self.setCentralWidget(central)
 
     # ── Menus ─────────────────────────────────────────────────────────
 
+    def create_actions(self):
+        """Build the window's actions once; the menus and toolbar share them."""
+        self.new_action = QAction(_icon("fa5s.file"), "&New Analysis", self)
+        self.new_action.setIconText("New")
+        self.new_action.setShortcut("Ctrl+N")
+        self.new_action.setStatusTip("Start a new analysis")
+        self.new_action.triggered.connect(self.new_analysis)
+
+        self.export_action = QAction(_icon("fa5s.file-export"), "&Export Results", self)
+        self.export_action.setIconText("Export")
+        self.export_action.setShortcut("Ctrl+E")
+        self.export_action.setStatusTip("Export current results")
+        self.export_action.triggered.connect(self.export_results)
+
+        self.exit_action = QAction(_icon("fa5s.sign-out-alt"), "E&xit", self)
+        self.exit_action.setShortcut("Ctrl+Q")
+        self.exit_action.triggered.connect(self.close)
+
+        self.clear_action = QAction(_icon("fa5s.eraser"), "&Clear Current Tab", self)
+        self.clear_action.setShortcut("Ctrl+L")
+        self.clear_action.triggered.connect(self.clear_current_tab)
+
+        # One checkable action, so the menu and toolbar can never disagree
+        self.theme_action = QAction(_icon("fa5s.moon"), "&Dark Mode", self)
+        self.theme_action.setIconText("Theme")
+        self.theme_action.setStatusTip("Toggle light / dark mode")
+        self.theme_action.setCheckable(True)
+        self.theme_action.setChecked(False)
+        self.theme_action.triggered.connect(self.toggle_theme)
+
+        self.about_action = QAction(_icon("fa5s.info-circle"), "&About", self)
+        self.about_action.setIconText("Help")
+        self.about_action.setStatusTip("About this application")
+        self.about_action.triggered.connect(self.show_about)
+
     def create_menus(self):
         menubar = self.menuBar()
 
         file_menu = menubar.addMenu("&File")
-
-        new_action = QAction(qta.icon("fa5s.file", color="#64748b"), "&New Analysis", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_analysis)
-        file_menu.addAction(new_action)
-
+        file_menu.addAction(self.new_action)
         file_menu.addSeparator()
-
-        export_action = QAction(qta.icon("fa5s.file-export", color="#64748b"), "&Export Results", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self.export_results)
-        file_menu.addAction(export_action)
-
+        file_menu.addAction(self.export_action)
         file_menu.addSeparator()
-
-        exit_action = QAction(qta.icon("fa5s.sign-out-alt", color="#64748b"), "E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        file_menu.addAction(self.exit_action)
 
         tools_menu = menubar.addMenu("&Tools")
-        clear_action = QAction(qta.icon("fa5s.eraser", color="#64748b"), "&Clear Current Tab", self)
-        clear_action.setShortcut("Ctrl+L")
-        clear_action.triggered.connect(self.clear_current_tab)
-        tools_menu.addAction(clear_action)
+        tools_menu.addAction(self.clear_action)
 
         view_menu = menubar.addMenu("&View")
-        self.dark_mode_action = QAction(qta.icon("fa5s.moon", color="#64748b"), "&Dark Mode", self)
-        self.dark_mode_action.setCheckable(True)
-        self.dark_mode_action.setChecked(False)
-        self.dark_mode_action.triggered.connect(self.toggle_theme)
-        view_menu.addAction(self.dark_mode_action)
+        view_menu.addAction(self.theme_action)
 
         help_menu = menubar.addMenu("&Help")
-        about_action = QAction(qta.icon("fa5s.info-circle", color="#64748b"), "&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        help_menu.addAction(self.about_action)
 
     # ── Toolbar ───────────────────────────────────────────────────────
 
@@ -164,30 +274,11 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(16, 16))
         self.addToolBar(toolbar)
 
-        new_btn = QAction(qta.icon("fa5s.file", color="#64748b"), "New", self)
-        new_btn.setStatusTip("Start a new analysis")
-        new_btn.triggered.connect(self.new_analysis)
-        toolbar.addAction(new_btn)
-
-        export_btn = QAction(qta.icon("fa5s.file-export", color="#64748b"), "Export", self)
-        export_btn.setStatusTip("Export current results")
-        export_btn.triggered.connect(self.export_results)
-        toolbar.addAction(export_btn)
-
+        toolbar.addAction(self.new_action)
+        toolbar.addAction(self.export_action)
         toolbar.addSeparator()
-
-        theme_btn = QAction(qta.icon("fa5s.adjust", color="#64748b"), "Theme", self)
-        theme_btn.setStatusTip("Toggle light / dark mode")
-        theme_btn.setCheckable(True)
-        theme_btn.setChecked(False)
-        theme_btn.triggered.connect(self.toggle_theme)
-        self.theme_toolbar_action = theme_btn
-        toolbar.addAction(theme_btn)
-
-        help_btn = QAction(qta.icon("fa5s.question-circle", color="#64748b"), "Help", self)
-        help_btn.setStatusTip("About this application")
-        help_btn.triggered.connect(self.show_about)
-        toolbar.addAction(help_btn)
+        toolbar.addAction(self.theme_action)
+        toolbar.addAction(self.about_action)
 
     # ── Status bar ────────────────────────────────────────────────────
 
@@ -204,83 +295,142 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Started new analysis", 3000)
 
     def clear_current_tab(self):
-        tab = self.tabs.currentWidget()
-        if hasattr(tab, "clear_inputs"):
-            tab.clear_inputs()
+        index = self.tabs.currentIndex()
+        clear = self._clear_callbacks.get(index)
+        if clear is not None:
+            clear()
             self.status_bar.showMessage("Cleared inputs", 3000)
 
     def show_about(self):
-        msg = QMessageBox(self)
-        msg.setWindowTitle("About CSE Stock Analyzer")
-        msg.setTextFormat(Qt.TextFormat.RichText)
-        text_color = "#e2e4e7" if self.dark_mode else "#1e293b"
-        msg.setText(
-            f"<h3 style='color:{text_color}'>CSE Stock Analyzer v1.0.0</h3>"
-            f"<p style='color:{text_color}'>Professional stock analysis for the Colombo Stock Exchange.</p>"
-            f"<p style='color:{text_color}'>Break-even, fees, fundamental &amp; technical analysis.</p>"
-            f"<p style='color:{text_color}'>&copy; 2026 CSE Tools</p>"
-        )
-        if self.dark_mode:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About CSE Stock Analyzer")
+            self._about_box.setTextFormat(Qt.TextFormat.RichText)
+            self._about_box.setText(_ABOUT_HTML)
+        self._about_box.exec()
 
     # ── Theme toggle ──────────────────────────────────────────────────
 
     def toggle_theme(self, checked):
+        if checked == self._theme_applied:
+            return
         self.apply_theme(checked)
-        # Sync both toggle actions without re-firing signals
-        self.dark_mode_action.blockSignals(True)
-        self.dark_mode_action.setChecked(checked)
-        self.dark_mode_action.blockSignals(False)
-        self.theme_toolbar_action.blockSignals(True)
-        self.theme_toolbar_action.setChecked(checked)
-        self.theme_toolbar_action.blockSignals(False)
+        # Keep the action in step when called directly (triggered won't re-fire)
+        self.theme_action.setChecked(checked)
 
     def apply_theme(self, dark_mode: bool):
+        if self._theme_applied == dark_mode:
+            return
         app = QApplication.instance()
         if app is None:
             return
+        self.setUpdatesEnabled(False)
+        try:
+            self._install_stylesheet(app, dark_mode)
+            QApplication.sendPostedEvents(None, QEvent.Type.StyleChange)
+            self.dark_mode = dark_mode
+            # Only the visible tab is restyled now; the others catch up when shown
+            self._theme_pending = set(self._theme_callbacks)
+            self._sync_tab_theme(self.tabs.currentIndex())
+            self._theme_applied = dark_mode
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _sync_tab_theme(self, index):
+        """Apply the current theme to the tab at ``index`` if it is stale."""
+        if index not in self._theme_pending:
+            return
+        self._theme_pending.discard(index)
+        # Batch the tab's restyle into one repaint
+        page = self.tabs.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            self._theme_callbacks[index](self.dark_mode)
+        finally:
+            page.setUpdatesEnabled(True)
+
+    def _install_stylesheet(self, app, dark_mode: bool):
+        """Install the cached application palette and stylesheet for a theme."""
+        qss = self._dark_stylesheet() if dark_mode else self._qss_light
         if dark_mode:
-            if qdarktheme is not None:
-                app.setStyleSheet(qdarktheme.load_stylesheet() + GLOBAL_STYLESHEET_DARK)  # type: ignore
-            else:
-                # Build a dark palette so Fusion renders dark base colors
-                palette = QPalette()
-                palette.setColor(QPalette.ColorRole.Window, QColor("#0f172a"))
-                palette.setColor(QPalette.ColorRole.WindowText, QColor("#e2e4e7"))
-                palette.setColor(QPalette.ColorRole.Base, QColor("#1e293b"))
-                palette.setColor(QPalette.ColorRole.AlternateBase, QColor("#0f172a"))
-                palette.setColor(QPalette.ColorRole.ToolTipBase, QColor("#1e293b"))
-                palette.setColor(QPalette.ColorRole.ToolTipText, QColor("#e2e4e7"))
-                palette.setColor(QPalette.ColorRole.Text, QColor("#e2e4e7"))
-                palette.setColor(QPalette.ColorRole.Button, QColor("#1e293b"))
-                palette.setColor(QPalette.ColorRole.ButtonText, QColor("#e2e4e7"))
-                palette.setColor(QPalette.ColorRole.BrightText, QColor("#ffffff"))
-                palette.setColor(QPalette.ColorRole.Link, QColor("#93c5fd"))
-                palette.setColor(QPalette.ColorRole.Highlight, QColor("#2563eb"))
-                palette.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-                palette.setColor(QPalette.ColorRole.PlaceholderText, QColor("#64748b"))
-                palette.setColor(QPalette.ColorRole.Light, QColor("#334155"))
-                palette.setColor(QPalette.ColorRole.Midlight, QColor("#1e293b"))
-                palette.setColor(QPalette.ColorRole.Dark, QColor("#0f172a"))
-                palette.setColor(QPalette.ColorRole.Mid, QColor("#334155"))
-                palette.setColor(QPalette.ColorRole.Shadow, QColor("#000000"))
-                app.setPalette(palette)  # type: ignore
-                app.setStyleSheet(GLOBAL_STYLESHEET_DARK)  # type: ignore
+            if _qdarktheme() is None:
+                # Dark palette so Fusion renders dark base colors; built once
+                if self._dark_palette is None:
+                    self._dark_palette = _build_dark_palette()
+                app.setPalette(self._dark_palette)  # type: ignore
         else:
             app.setPalette(self.style().standardPalette())  # type: ignore
-            app.setStyleSheet(GLOBAL_STYLESHEET)  # type: ignore
-        self.dark_mode = dark_mode
-        for tab in [self.breakeven_tab, self.fees_tab, self.fundamental_tab,
-                     self.technical_tab, self.complete_tab, self.history_tab]:
-            if hasattr(tab, "apply_theme"):
-                tab.apply_theme(dark_mode)
+        # Re-parsing an identical sheet still re-polishes every widget
+        if app.styleSheet() != qss:
+            app.setStyleSheet(qss)  # type: ignore
+
+    def _dark_stylesheet(self):
+        """Compose (once) the dark sheet, layered on qdarktheme when installed."""
+        if self._qss_dark is None:
+            qdarktheme = _qdarktheme()
+            if qdarktheme is not None:
+                self._qss_dark = qdarktheme.load_stylesheet() + build_stylesheet("dark")
+            else:
+                self._qss_dark = build_stylesheet("dark")
+        return self._qss_dark
 
     def on_tab_changed(self, index):
         """Handle tab changes."""
-        # Refresh history if history tab (index 5) is selected
-        if self.tabs.widget(index) == self.history_tab:
-            self.history_tab.refresh_history()
+        if index in self._tab_factories:
+            # Freshly built tabs load their own data
+            self._materialize_tab(index)
+            return
+        self._sync_tab_theme(index)
+        # Reload history only if an analysis was saved since the last view,
+        # after the tab switch has painted
+        if index == self._HISTORY_INDEX and self._history_dirty:
+            self._history_dirty = False
+            QTimer.singleShot(0, self._tab_instances[index].refresh_history)
+
+    def _mark_history_dirty(self):
+        self._history_dirty = True
+
+    def _materialize_tab(self, index):
+        """Replace the placeholder at ``index`` with its real tab widget."""
+        if index not in self._tab_factories:
+            return self._tab_instances.get(index)
+        label, module, class_name, icon = self._tab_factories.pop(index)
+        tab = getattr(importlib.import_module(module), class_name)()
+        placeholder = self.tabs.widget(index)
+        was_current = self.tabs.currentIndex() == index
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, _icon(icon), label)
+            if was_current:
+                self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._tab_instances[index] = tab
+        if index == self._HISTORY_INDEX:
+            # A new HistoryTab has just loaded the current rows
+            self._history_dirty = False
+        if hasattr(tab, "analysis_saved"):
+            tab.analysis_saved.connect(self._mark_history_dirty)
+        if hasattr(tab, "clear_inputs"):
+            self._clear_callbacks[index] = tab.clear_inputs
+        if hasattr(tab, "apply_theme"):
+            self._theme_callbacks[index] = tab.apply_theme
+            if self._theme_applied is not None:
+                tab.apply_theme(self.dark_mode)
+        return tab
+
+    @property
+    def complete_tab(self):
+        """The Complete Analysis tab, built on first access."""
+        return self._materialize_tab(self._TAB_INDEX["Complete Analysis"])
+
+    @property
+    def history_tab(self):
+        """The History tab, built on first access."""
+        return self._materialize_tab(self._HISTORY_INDEX)
 
     def update_status(self, message, timeout=0):
         self.status_bar.showMessage(message, timeout)
@@ -290,12 +440,14 @@ class MainWindow(QMainWindow):
         # Get result from the active tab (currently only Complete Analysis tab supports full export)
         # We check if CompleteAnalysisTab has 'last_result' attribute
         
-        if not hasattr(self.complete_tab, 'last_result') or not self.complete_tab.last_result:
+        # An unbuilt Complete Analysis tab cannot hold results yet
+        complete_tab = self._tab_instances.get(self._TAB_INDEX["Complete Analysis"])
+        if complete_tab is None or not getattr(complete_tab, 'last_result', None):
             logger.warning("Export failed: No analysis results available")
             QMessageBox.warning(self, "Export Error", "No analysis results available to export.\nPlease run an analysis first.")
             return
             
-        result = self.complete_tab.last_result
+        result = complete_tab.last_result
         
         # Open file dialog
         filepath, filter_type = QFileDialog.getSaveFileName(
@@ -311,35 +463,25 @@ class MainWindow(QMainWindow):
             
         try:
             logger.info(f"Exporting results to {filepath} with filter {filter_type}")
-            if filter_type.startswith("PDF"):
-                if not filepath.lower().endswith('.pdf'):
-                    filepath += '.pdf'
-                saved_path = generate_pdf_report(result, filepath)
-                
-            elif filter_type.startswith("CSV"):
-                if not filepath.lower().endswith('.csv'):
-                    filepath += '.csv'
-                saved_path = export_to_csv(result, filepath)
-                
-            elif filter_type.startswith("Excel"):
-                if not filepath.lower().endswith('.xlsx'):
-                    filepath += '.xlsx'
-                saved_path = export_to_excel(result, filepath)
-                
-            else:
-                # Default to PDF if something weird happens (or infer from extension)
-                if filepath.lower().endswith('.csv'):
-                    saved_path = export_to_csv(result, filepath)
-                elif filepath.lower().endswith('.xlsx'):
-                    saved_path = export_to_excel(result, filepath)
-                else:
-                    if not filepath.lower().endswith('.pdf'):
-                        filepath += '.pdf'
-                    saved_path = generate_pdf_report(result, filepath)
+            ext = _FILTER_EXT.get(filter_type.split(" ", 1)[0])
+            if ext is None:
+                # Unknown filter: infer from the extension, defaulting to PDF
+                ext = os.path.splitext(filepath)[1].lower()
+                if ext not in _EXPORTERS:
+                    ext = ".pdf"
+            if not filepath.lower().endswith(ext):
+                filepath += ext
+            # Exporters pull in fpdf / pandas, so import only the one needed
+            module, func_name = _EXPORTERS[ext]
+            exporter = getattr(importlib.import_module(module), func_name)
+            saved_path = exporter(result, filepath)
 
             QMessageBox.information(self, "Export Successful", f"Report saved successfully to:\n{saved_path}")
             logger.info(f"Export successful to {saved_path}")
             
+        except ImportError as e:
+            logger.error(f"Export unavailable: {e}")
+            QMessageBox.critical(self, "Export Failed", f"This export format needs a missing package:\n{e.name or e}")
         except Exception as e:
             logger.exception(f"Export failed: {str(e)}")
             QMessageBox.critical(self, "Export Failed", f"Failed to export report:\n{str(e)}")
@@ -3,78 +3,153 @@ Clean, modern styling for CSE Stock Analyzer GUI.
 Flat design with subtle accents - no heavy gradients or oversized elements.
 """
 
-# --- Color Palette ---
-PRIMARY = "#2563eb"
-PRIMARY_LIGHT = "#dbeafe"
-PRIMARY_HOVER = "#1d4ed8"
-PRIMARY_DARK = "#1e40af"
-
-SUCCESS = "#059669"
-SUCCESS_LIGHT = "#d1fae5"
-
-WARNING = "#d97706"
-WARNING_LIGHT = "#fef3c7"
-
-DANGER = "#dc2626"
-DANGER_LIGHT = "#fee2e2"
-
-INFO = "#0891b2"
-INFO_LIGHT = "#cffafe"
+import functools
+import os
+import re
+from dataclasses import asdict, dataclass, replace
+from string import Template
+from typing import Final, Literal, Mapping
 
-BG = "#f1f5f9"
-SURFACE = "#ffffff"
-TEXT = "#1e293b"
-TEXT_DIM = "#64748b"
-TEXT_MUTED = "#94a3b8"
-BORDER = "#e2e8f0"
-HOVER = "#f8fafc"
-
-_D_BG = "#0f172a"
-_D_SURFACE = "#1e293b"
-_D_TEXT = "#e2e4e7"
-_D_TEXT_DIM = "#94a3b8"
-_D_BORDER = "#334155"
+# --- Color Palette ---
+@dataclass(frozen=True, slots=True)
+class Palette:
+    """Colour set for one theme; field names double as stylesheet template slots."""
+
+    primary: str
+    primary_light: str
+    primary_hover: str
+    primary_dark: str
+    success: str
+    success_light: str
+    warning: str
+    warning_light: str
+    danger: str
+    danger_light: str
+    info: str
+    info_light: str
+    bg: str
+    surface: str
+    text: str
+    text_dim: str
+    text_muted: str
+    border: str
+    hover: str
+
+
+LIGHT = Palette(
+    primary="#2563eb",
+    primary_light="#dbeafe",
+    primary_hover="#1d4ed8",
+    primary_dark="#1e40af",
+    success="#059669",
+    success_light="#d1fae5",
+    warning="#d97706",
+    warning_light="#fef3c7",
+    danger="#dc2626",
+    danger_light="#fee2e2",
+    info="#0891b2",
+    info_light="#cffafe",
+    bg="#f1f5f9",
+    surface="#ffffff",
+    text="#1e293b",
+    text_dim="#64748b",
+    text_muted="#94a3b8",
+    border="#e2e8f0",
+    hover="#f8fafc",
+)
+
+# Dark mode keeps the accents and swaps the surface/text/border set
+DARK = replace(
+    LIGHT,
+    bg="#0f172a",
+    surface="#1e293b",
+    text="#e2e4e7",
+    text_dim="#94a3b8",
+    border="#334155",
+)
+
+# Flat names used by the tabs and the card styles below
+PRIMARY = LIGHT.primary
+PRIMARY_LIGHT = LIGHT.primary_light
+PRIMARY_HOVER = LIGHT.primary_hover
+PRIMARY_DARK = LIGHT.primary_dark
+
+SUCCESS = LIGHT.success
+SUCCESS_LIGHT = LIGHT.success_light
+
+WARNING = LIGHT.warning
+WARNING_LIGHT = LIGHT.warning_light
+
+DANGER = LIGHT.danger
+DANGER_LIGHT = LIGHT.danger_light
+
+INFO = LIGHT.info
+INFO_LIGHT = LIGHT.info_light
+
+BG = LIGHT.bg
+SURFACE = LIGHT.surface
+TEXT = LIGHT.text
+TEXT_DIM = LIGHT.text_dim
+TEXT_MUTED = LIGHT.text_muted
+BORDER = LIGHT.border
+HOVER = LIGHT.hover
+
+_D_BG = DARK.bg
+_D_SURFACE = DARK.surface
+_D_TEXT = DARK.text
+_D_TEXT_DIM = DARK.text_dim
+_D_BORDER = DARK.border
 
 # aliases kept for imports in tabs
 TEXT_SECONDARY = TEXT_DIM
 TEXT_SECONDARY_DARK = _D_TEXT_DIM
-# legacy aliases
-PRIMARY_COLOR = PRIMARY
-PRIMARY_LIGHT_COLOR = PRIMARY_LIGHT
-SUCCESS_COLOR = SUCCESS
-WARNING_COLOR = WARNING
-DANGER_COLOR = DANGER
-CARD_BG = SURFACE
-TEXT_PRIMARY = TEXT
-BORDER_COLOR = BORDER
-BACKGROUND = BG
 
 FONT = "'Segoe UI', 'Roboto', 'Helvetica Neue', sans-serif"
 
-GLOBAL_STYLESHEET = f"""
-QMainWindow {{
-    background: {BG};
-    font-family: {FONT};
-}}
+# Set CSE_QSS_DEBUG=1 to keep the sheets readable when inspecting them
+_MINIFY_QSS = not os.environ.get("CSE_QSS_DEBUG")
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT = re.compile(r"\s*([{};,])\s*")
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt's parser has less to scan."""
+    if not _MINIFY_QSS:
+        return qss
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    return _QSS_PUNCT.sub(r"\1", qss).replace(": ", ":").strip()
+
 
-#HeaderBar {{
+_LIGHT_QSS = """
+QMainWindow {
+    background: ${bg};
+    font-family: ${font};
+}
+
+#HeaderBar {
     background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-        stop:0 {PRIMARY}, stop:1 {PRIMARY_HOVER});
+        stop:0 ${primary}, stop:1 ${primary_hover});
     border: none;
     border-radius: 10px;
-}}
-#HeaderTitle {{
+}
+#HeaderTitle {
     color: #fff;
     font-size: 17px;
     font-weight: 700;
     letter-spacing: 0.3px;
-}}
-#HeaderSubtitle {{
+}
+#HeaderSep {
+    color: rgba(255,255,255,0.4);
+    font-size: 14px;
+}
+#HeaderSubtitle {
     color: rgba(255,255,255,0.78);
     font-size: 12px;
     font-weight: 400;
-}}
-#HeaderBadge {{
+}
+#HeaderBadge {
     color: rgba(255,255,255,0.9);
     background: rgba(255,255,255,0.15);
     border: 1px solid rgba(255,255,255,0.3);
@@ -82,21 +157,21 @@ QMainWindow {{
     padding: 2px 8px;
     font-size: 10px;
     font-weight: 600;
-}}
+}
 
-QTabWidget::pane {{
-    border: 1px solid {BORDER};
-    background: {SURFACE};
+QTabWidget::pane {
+    border: 1px solid ${border};
+    background: ${surface};
     border-radius: 10px;
     padding: 6px;
-}}
-QTabWidget::tab-bar {{
+}
+QTabWidget::tab-bar {
     alignment: left;
     left: 8px;
-}}
-QTabBar::tab {{
+}
+QTabBar::tab {
     background: transparent;
-    color: {TEXT_DIM};
+    color: ${text_dim};
     padding: 8px 16px;
     margin-right: 2px;
     font-size: 13px;
@@ -104,68 +179,110 @@ QTabBar::tab {{
     border-bottom: 2px solid transparent;
     border-top-left-radius: 6px;
     border-top-right-radius: 6px;
-}}
-QTabBar::tab:selected {{
-    color: {PRIMARY};
-    border-bottom: 2px solid {PRIMARY};
-    background: {HOVER};
-}}
-QTabBar::tab:hover:!selected {{
-    background: {HOVER};
-    color: {TEXT};
-}}
-
-QLabel {{
-    color: {TEXT};
-    font-family: {FONT};
+}
+QTabBar::tab:selected {
+    color: ${primary};
+    border-bottom: 2px solid ${primary};
+    background: ${hover};
+}
+QTabBar::tab:hover:!selected {
+    background: ${hover};
+    color: ${text};
+}
+
+QLabel {
+    color: ${text};
+    font-family: ${font};
     font-size: 13px;
-}}
-QLabel[heading="true"] {{
+}
+QLabel[heading="true"] {
     font-size: 18px;
     font-weight: 700;
-    color: {TEXT};
+    color: ${text};
     padding: 2px 0;
-}}
-QLabel[subheading="true"] {{
+}
+QLabel[subheading="true"] {
     font-size: 14px;
     font-weight: 600;
-    color: {TEXT};
+    color: ${text};
     padding-bottom: 2px;
-}}
+}
+QLabel[role="placeholder"] {
+    color: ${text_dim};
+    font-size: 12px;
+    padding: 12px;
+}
+QLabel[role="caption"] {
+    color: ${text_dim};
+    font-size: 11px;
+}
+QLabel[role="hint"] {
+    color: ${text_dim};
+    font-size: 11px;
+    padding: 6px 8px;
+    background-color: #f3f4f6;
+    border-radius: 4px;
+}
+QFrame[role="card"] {
+    background-color: ${surface};
+    border: 1px solid ${border};
+    border-radius: 8px;
+    padding: 12px;
+}
+QLabel[role="card-title"] {
+    color: ${text_dim};
+    font-size: 10px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+QLabel[role="recommendation"] {
+    color: ${text};
+    font-size: 28px;
+    font-weight: bold;
+}
+QLabel[role="confidence"] {
+    color: ${text};
+    font-size: 12px;
+    background: #e0f2fe;
+    padding: 3px 10px;
+    border-radius: 10px;
+}
+QLabel[role="insight-title"] {
+    color: ${text};
+    font-size: 13px;
+    font-weight: bold;
+}
+QLabel[role="insight"] {
+    color: ${text};
+    font-size: 12px;
+    padding: 4px;
+}
 
-QLineEdit, QTextEdit {{
-    background: {SURFACE};
-    border: 1px solid {BORDER};
+QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+    background: ${surface};
+    border: 1px solid ${border};
     border-radius: 6px;
     padding: 6px 10px;
     font-size: 13px;
-    color: {TEXT};
-    selection-background-color: {PRIMARY_LIGHT};
-}}
-QLineEdit:focus, QTextEdit:focus {{
-    border: 1.5px solid {PRIMARY};
+    color: ${text};
+}
+QLineEdit, QTextEdit {
+    selection-background-color: ${primary_light};
+}
+QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
+    border: 1.5px solid ${primary};
+}
+QLineEdit:focus, QTextEdit:focus {
     background: #fafbff;
-}}
-QLineEdit:disabled {{
-    background: {BG};
-    color: {TEXT_MUTED};
-    border: 1px dashed {BORDER};
-}}
-
-QSpinBox, QDoubleSpinBox {{
-    background: {SURFACE};
-    border: 1px solid {BORDER};
-    border-radius: 6px;
-    padding: 6px 10px;
-    font-size: 13px;
-    color: {TEXT};
-}}
-QSpinBox:focus, QDoubleSpinBox:focus {{
-    border: 1.5px solid {PRIMARY};
-}}
-
-QPushButton {{
-    background: {PRIMARY};
+}
+QLineEdit:disabled {
+    background: ${bg};
+    color: ${text_muted};
+    border: 1px dashed ${border};
+}
+
+QPushButton {
+    background: ${primary};
     color: #fff;
     border: none;
     border-radius: 6px;
@@ -173,326 +290,322 @@ QPushButton {{
     font-size: 13px;
     font-weight: 600;
     min-height: 30px;
-}}
-QPushButton:hover {{
-    background: {PRIMARY_HOVER};
-}}
-QPushButton:pressed {{
-    background: {PRIMARY_DARK};
-}}
-QPushButton:disabled {{
+}
+QPushButton:hover {
+    background: ${primary_hover};
+}
+QPushButton:pressed {
+    background: ${primary_dark};
+}
+QPushButton:disabled {
     background: #cbd5e1;
     color: #94a3b8;
-}}
-QPushButton[buttonStyle="success"] {{
-    background: {SUCCESS};
-}}
-QPushButton[buttonStyle="success"]:hover {{
+}
+QPushButton[buttonStyle="success"] {
+    background: ${success};
+}
+QPushButton[buttonStyle="success"]:hover {
     background: #047857;
-}}
-QPushButton[buttonStyle="danger"] {{
-    background: {DANGER};
-}}
-QPushButton[buttonStyle="danger"]:hover {{
+}
+QPushButton[buttonStyle="danger"] {
+    background: ${danger};
+}
+QPushButton[buttonStyle="danger"]:hover {
     background: #b91c1c;
-}}
-QPushButton[buttonStyle="secondary"] {{
+}
+QPushButton[buttonStyle="secondary"] {
     background: transparent;
-    color: {PRIMARY};
-    border: 1px solid {BORDER};
-}}
-QPushButton[buttonStyle="secondary"]:hover {{
-    background: {PRIMARY_LIGHT};
-    border-color: {PRIMARY};
-}}
-
-QCheckBox, QRadioButton {{
-    color: {TEXT};
+    color: ${primary};
+    border: 1px solid ${border};
+}
+QPushButton[buttonStyle="secondary"]:hover {
+    background: ${primary_light};
+    border-color: ${primary};
+}
+
+QCheckBox, QRadioButton {
+    color: ${text};
     font-size: 13px;
     spacing: 6px;
     padding: 2px;
-}}
-QCheckBox::indicator {{
+}
+QCheckBox::indicator, QRadioButton::indicator {
     width: 16px; height: 16px;
-    border: 1.5px solid {BORDER};
+    border: 1.5px solid ${border};
     border-radius: 3px;
     background: #fff;
-}}
-QCheckBox::indicator:checked {{
-    background: {PRIMARY};
-    border-color: {PRIMARY};
-}}
-QRadioButton::indicator {{
-    width: 16px; height: 16px;
-    border: 1.5px solid {BORDER};
+}
+QRadioButton::indicator {
     border-radius: 8px;
-    background: #fff;
-}}
-QRadioButton::indicator:checked {{
-    background: {PRIMARY};
-    border-color: {PRIMARY};
-}}
-
-QTableWidget {{
-    background: {SURFACE};
-    border: 1px solid {BORDER};
+}
+QCheckBox::indicator:checked, QRadioButton::indicator:checked {
+    background: ${primary};
+    border-color: ${primary};
+}
+
+QTableView {
+    background: ${surface};
+    border: 1px solid ${border};
     border-radius: 6px;
     gridline-color: transparent;
     font-size: 12px;
-    color: {TEXT};
+    color: ${text};
     outline: none;
-}}
-QTableWidget::item {{
+}
+QTableView::item {
     padding: 5px 8px;
     border-bottom: 1px solid #f1f5f9;
-}}
-QTableWidget::item:selected {{
-    background: {PRIMARY_LIGHT};
-    color: {PRIMARY};
-}}
-QTableWidget::item:alternate {{
-    background: {BG};
-}}
-QHeaderView {{
-    background: {SURFACE};
-}}
-QHeaderView::section {{
-    background: {BG};
-    color: {TEXT_DIM};
+}
+QTableView::item:selected {
+    background: ${primary_light};
+    color: ${primary};
+}
+QTableView::item:alternate {
+    background: ${bg};
+}
+QHeaderView {
+    background: ${surface};
+}
+QHeaderView::section {
+    background: ${bg};
+    color: ${text_dim};
     padding: 5px 8px;
     border: none;
-    border-bottom: 1.5px solid {BORDER};
+    border-bottom: 1.5px solid ${border};
     font-weight: 700;
     font-size: 11px;
     text-transform: uppercase;
     letter-spacing: 0.5px;
-}}
+}
 
-QScrollBar:vertical {{
+QScrollBar:vertical {
     border: none;
     background: transparent;
     width: 7px;
-}}
-QScrollBar::handle:vertical {{
-    background: {BORDER};
+}
+QScrollBar::handle:vertical {
+    background: ${border};
     min-height: 24px;
     border-radius: 3px;
-}}
-QScrollBar::handle:vertical:hover {{
-    background: {TEXT_MUTED};
-}}
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+}
+QScrollBar::handle:vertical:hover {
+    background: ${text_muted};
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0;
-}}
+}
 
-QScrollArea {{
-    background: {BG};
+QScrollArea {
+    background: ${bg};
     border: none;
-}}
-QScrollArea > QWidget > QWidget {{
-    background: {BG};
-}}
-QScrollArea QGroupBox {{
-    background: {SURFACE};
-}}
-
-QGroupBox {{
-    border: 1px solid {BORDER};
+}
+QScrollArea > QWidget > QWidget {
+    background: ${bg};
+}
+QScrollArea QGroupBox {
+    background: ${surface};
+}
+
+QGroupBox {
+    border: 1px solid ${border};
     border-radius: 8px;
     margin-top: 12px;
     padding: 12px 10px 10px 10px;
     font-weight: 600;
-    color: {TEXT};
-    background: {SURFACE};
-}}
-QGroupBox::title {{
+    color: ${text};
+    background: ${surface};
+}
+QGroupBox::title {
     subcontrol-origin: margin;
     subcontrol-position: top left;
     left: 10px;
     padding: 2px 8px;
-    background: {PRIMARY};
+    background: ${primary};
     color: #fff;
     font-size: 11px;
     font-weight: 700;
     border-radius: 6px;
-}}
+}
 
-QComboBox {{
-    background: {SURFACE};
-    border: 1px solid {BORDER};
-    border-radius: 6px;
-    padding: 6px 10px;
-    font-size: 13px;
-    color: {TEXT};
-}}
-QComboBox:focus {{
-    border: 1.5px solid {PRIMARY};
-}}
-QComboBox::drop-down {{
+QComboBox::drop-down {
     border: none;
     width: 24px;
-}}
-QComboBox QAbstractItemView {{
-    background: {SURFACE};
-    border: 1px solid {BORDER};
-    selection-background-color: {PRIMARY_LIGHT};
+}
+QComboBox QAbstractItemView {
+    background: ${surface};
+    border: 1px solid ${border};
+    selection-background-color: ${primary_light};
     padding: 2px;
-}}
+}
 
-QStatusBar {{
-    background: {SURFACE};
-    color: {TEXT_DIM};
+QStatusBar {
+    background: ${surface};
+    color: ${text_dim};
     font-size: 12px;
-    border-top: 1px solid {BORDER};
+    border-top: 1px solid ${border};
     padding: 2px 8px;
-}}
+}
 
-QMenuBar {{
-    background: {SURFACE};
-    color: {TEXT};
-    border-bottom: 1px solid {BORDER};
+QMenuBar {
+    background: ${surface};
+    color: ${text};
+    border-bottom: 1px solid ${border};
     font-size: 13px;
-}}
-QMenuBar::item {{
+}
+QMenuBar::item {
     padding: 5px 10px;
-}}
-QMenuBar::item:selected {{
-    background: {BG};
+}
+QMenuBar::item:selected {
+    background: ${bg};
     border-radius: 4px;
-}}
-QMenu {{
-    background: {SURFACE};
-    color: {TEXT};
-    border: 1px solid {BORDER};
+}
+QMenu {
+    background: ${surface};
+    color: ${text};
+    border: 1px solid ${border};
     padding: 4px;
     border-radius: 6px;
-}}
-QMenu::item {{
+}
+QMenu::item {
     padding: 5px 18px;
     border-radius: 4px;
-}}
-QMenu::item:selected {{
-    background: {PRIMARY};
+}
+QMenu::item:selected {
+    background: ${primary};
     color: #fff;
-}}
+}
 
-QToolBar {{
-    background: {SURFACE};
-    border-bottom: 1px solid {BORDER};
+QToolBar {
+    background: ${surface};
+    border-bottom: 1px solid ${border};
     spacing: 4px;
     padding: 3px 6px;
-}}
-QToolButton {{
+}
+QToolButton {
     background: transparent;
-    color: {TEXT};
-    border: 1px solid {BORDER};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 5px;
     padding: 4px 10px;
     font-weight: 600;
     font-size: 12px;
     min-height: 24px;
     min-width: 44px;
-}}
-QToolButton:hover {{
-    background: {PRIMARY_LIGHT};
-    border-color: {PRIMARY};
-    color: {PRIMARY};
-}}
-QToolButton:pressed, QToolButton:checked {{
-    background: {PRIMARY};
+}
+QToolButton:hover {
+    background: ${primary_light};
+    border-color: ${primary};
+    color: ${primary};
+}
+QToolButton:pressed, QToolButton:checked {
+    background: ${primary};
     color: #fff;
-    border-color: {PRIMARY};
-}}
+    border-color: ${primary};
+}
 """
 
-GLOBAL_STYLESHEET_DARK = f"""
-QMainWindow {{ background: {_D_BG}; }}
+_DARK_QSS = """
+QMainWindow { background: ${bg}; }
 
-QScrollArea {{
-    background: {_D_BG};
+QScrollArea {
+    background: ${bg};
     border: none;
-}}
-QScrollArea > QWidget > QWidget {{
-    background: {_D_BG};
-}}
-QScrollArea QGroupBox {{
-    background: {_D_SURFACE};
-}}
-
-#HeaderBar {{
+}
+QScrollArea > QWidget > QWidget {
+    background: ${bg};
+}
+QScrollArea QGroupBox {
+    background: ${surface};
+}
+
+#HeaderBar {
     background: qlineargradient(x1:0,y1:0,x2:1,y2:0,
-        stop:0 {PRIMARY_DARK}, stop:1 {PRIMARY});
+        stop:0 ${primary_dark}, stop:1 ${primary});
     border: none; border-radius: 10px;
-}}
-#HeaderTitle {{ color:#fff; font-size:17px; font-weight:700; }}
-#HeaderSubtitle {{ color:rgba(255,255,255,0.72); font-size:12px; }}
-#HeaderBadge {{
+}
+#HeaderTitle { color:#fff; font-size:17px; font-weight:700; }
+#HeaderSep { color:rgba(255,255,255,0.4); font-size:14px; }
+#HeaderSubtitle { color:rgba(255,255,255,0.72); font-size:12px; }
+#HeaderBadge {
     color:rgba(255,255,255,0.85);
     background:rgba(255,255,255,0.1);
     border:1px solid rgba(255,255,255,0.22);
     border-radius:10px; padding:2px 8px;
     font-size:10px; font-weight:600;
-}}
+}
 
-QTabWidget::pane {{
-    border:1px solid {_D_BORDER};
-    background:{_D_SURFACE};
+QTabWidget::pane {
+    border:1px solid ${border};
+    background:${surface};
     border-radius:10px; padding:6px;
-}}
-QTabBar::tab {{
-    background:transparent; color:{_D_TEXT_DIM};
+}
+QTabBar::tab {
+    background:transparent; color:${text_dim};
     padding:8px 16px; font-size:13px; font-weight:600;
     border-bottom:2px solid transparent;
     border-top-left-radius:6px; border-top-right-radius:6px;
     margin-right:2px;
-}}
-QTabBar::tab:selected {{
+}
+QTabBar::tab:selected {
     color:#93c5fd;
     border-bottom:2px solid #93c5fd;
     background:rgba(255,255,255,0.04);
-}}
-QTabBar::tab:hover:!selected {{
+}
+QTabBar::tab:hover:!selected {
     background:rgba(255,255,255,0.03);
-    color:{_D_TEXT};
-}}
-
-QLabel {{ color:{_D_TEXT}; }}
-QLabel[heading="true"] {{ color:{_D_TEXT}; }}
-QLabel[subheading="true"] {{ color:{_D_TEXT}; }}
-
-QGroupBox {{
-    border:1px solid {_D_BORDER}; border-radius:8px;
+    color:${text};
+}
+
+QLabel { color:${text}; }
+QLabel[heading="true"] { color:${text}; }
+QLabel[subheading="true"] { color:${text}; }
+QLabel[role="placeholder"] { color:${text_dim}; font-size:12px; padding:12px; }
+QLabel[role="caption"] { color:${text_dim}; font-size:11px; }
+QLabel[role="hint"] { color:${text_dim}; font-size:11px; padding:6px 8px; background-color:#1f2937; border-radius:4px; }
+QFrame[role="card"] { background-color:${surface}; border:1px solid ${border}; border-radius:8px; padding:12px; }
+QLabel[role="card-title"] { color:${text_dim}; font-size:10px; font-weight:bold; letter-spacing:1px; }
+QLabel[role="recommendation"] { color:${text}; font-size:28px; font-weight:bold; }
+QLabel[role="confidence"] { color:#93c5fd; font-size:12px; background:rgba(59,130,246,0.15); padding:3px 10px; border-radius:10px; }
+QLabel[role="insight-title"] { color:${text}; font-size:13px; font-weight:bold; }
+QLabel[role="insight"] { color:${text}; font-size:12px; padding:4px; }
+
+QGroupBox {
+    border:1px solid ${border}; border-radius:8px;
     margin-top:12px; padding:12px 10px 10px 10px;
-    color:{_D_TEXT}; background:{_D_SURFACE};
-}}
-QGroupBox::title {{
+    color:${text}; background:${surface};
+}
+QGroupBox::title {
     subcontrol-origin:margin; subcontrol-position:top left;
     left:10px; padding:2px 8px;
-    background:{PRIMARY_DARK}; color:#fff;
+    background:${primary_dark}; color:#fff;
     font-size:11px; font-weight:700; border-radius:6px;
-}}
+}
 
-QLineEdit, QTextEdit {{
+QLineEdit, QTextEdit, QSpinBox, QDoubleSpinBox, QComboBox {
     background: #0f172a;
-    border: 1px solid {_D_BORDER};
+    border: 1px solid ${border};
     border-radius: 6px;
     padding: 6px 10px;
     font-size: 13px;
-    color: {_D_TEXT};
+    color: ${text};
+}
+QLineEdit, QTextEdit {
     selection-background-color: #1e3a5f;
-}}
-QLineEdit:focus, QTextEdit:focus {{
+}
+QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
     border: 1.5px solid #60a5fa;
+}
+QLineEdit:focus, QTextEdit:focus {
     background: #131c2e;
-}}
-QLineEdit:disabled {{
+}
+QLineEdit:disabled {
     background: #0c1322;
     color: #475569;
-    border: 1px dashed {_D_BORDER};
-}}
+    border: 1px dashed ${border};
+}
 
-QPushButton {{
-    background: {PRIMARY};
+QPushButton {
+    background: ${primary};
     color: #fff;
     border: none;
     border-radius: 6px;
@@ -500,241 +613,268 @@ QPushButton {{
     font-size: 13px;
     font-weight: 600;
     min-height: 30px;
-}}
-QPushButton:hover {{ background: #3b82f6; }}
-QPushButton:pressed {{ background: {PRIMARY_DARK}; }}
-QPushButton:disabled {{ background: #334155; color: #64748b; }}
-QPushButton[buttonStyle="success"] {{ background: {SUCCESS}; }}
-QPushButton[buttonStyle="success"]:hover {{ background: #10b981; }}
-QPushButton[buttonStyle="danger"] {{ background: {DANGER}; }}
-QPushButton[buttonStyle="danger"]:hover {{ background: #ef4444; }}
-QPushButton[buttonStyle="secondary"] {{
+}
+QPushButton:hover { background: #3b82f6; }
+QPushButton:pressed { background: ${primary_dark}; }
+QPushButton:disabled { background: #334155; color: #64748b; }
+QPushButton[buttonStyle="success"] { background: ${success}; }
+QPushButton[buttonStyle="success"]:hover { background: #10b981; }
+QPushButton[buttonStyle="danger"] { background: ${danger}; }
+QPushButton[buttonStyle="danger"]:hover { background: #ef4444; }
+QPushButton[buttonStyle="secondary"] {
     background: transparent;
     color: #93c5fd;
-    border: 1px solid {_D_BORDER};
-}}
-QPushButton[buttonStyle="secondary"]:hover {{
+    border: 1px solid ${border};
+}
+QPushButton[buttonStyle="secondary"]:hover {
     background: rgba(59,130,246,0.15);
     border-color: #60a5fa;
-}}
+}
 
-QCheckBox, QRadioButton {{ color:{_D_TEXT}; font-size:13px; }}
-QCheckBox::indicator {{
+QCheckBox, QRadioButton { color:${text}; font-size:13px; }
+QCheckBox::indicator, QRadioButton::indicator {
     width:16px; height:16px;
-    border:1.5px solid {_D_BORDER};
+    border:1.5px solid ${border};
     border-radius:3px; background:#0f172a;
-}}
-QCheckBox::indicator:checked {{ background:{PRIMARY}; border-color:{PRIMARY}; }}
-QRadioButton::indicator {{
-    width:16px; height:16px;
-    border:1.5px solid {_D_BORDER};
-    border-radius:8px; background:#0f172a;
-}}
-QRadioButton::indicator:checked {{ background:{PRIMARY}; border-color:{PRIMARY}; }}
-
-QTableWidget {{
-    background: {_D_SURFACE};
-    border: 1px solid {_D_BORDER};
+}
+QRadioButton::indicator { border-radius:8px; }
+QCheckBox::indicator:checked, QRadioButton::indicator:checked {
+    background:${primary}; border-color:${primary};
+}
+
+QTableView {
+    background: ${surface};
+    border: 1px solid ${border};
     border-radius: 6px;
     gridline-color: transparent;
     font-size: 12px;
-    color: {_D_TEXT};
+    color: ${text};
     outline: none;
-}}
-QTableWidget::item {{
+}
+QTableView::item {
     padding: 5px 8px;
     border-bottom: 1px solid #1e293b;
-    color: {_D_TEXT};
-}}
-QTableWidget::item:selected {{
+    color: ${text};
+}
+QTableView::item:selected {
     background: rgba(59,130,246,0.25);
     color: #93c5fd;
-}}
-QTableWidget::item:alternate {{ background: #0f172a; }}
-QHeaderView {{ background: {_D_SURFACE}; }}
-QHeaderView::section {{
+}
+QTableView::item:alternate { background: #0f172a; }
+QHeaderView { background: ${surface}; }
+QHeaderView::section {
     background: #0f172a;
-    color: {_D_TEXT_DIM};
+    color: ${text_dim};
     padding: 5px 8px;
     border: none;
-    border-bottom: 1.5px solid {_D_BORDER};
+    border-bottom: 1.5px solid ${border};
     font-weight: 700;
     font-size: 11px;
-}}
+}
 
-QScrollBar:vertical {{
+QScrollBar:vertical {
     border:none; background:transparent; width:7px;
-}}
-QScrollBar::handle:vertical {{
-    background:{_D_BORDER}; min-height:24px; border-radius:3px;
-}}
-QScrollBar::handle:vertical:hover {{ background:#475569; }}
-QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ height:0; }}
-
-QSpinBox, QDoubleSpinBox {{
-    background:#0f172a; border:1px solid {_D_BORDER};
-    border-radius:6px; padding:6px 10px;
-    font-size:13px; color:{_D_TEXT};
-}}
-QSpinBox:focus, QDoubleSpinBox:focus {{ border:1.5px solid #60a5fa; }}
-
-QComboBox {{
-    background:#0f172a; border:1px solid {_D_BORDER};
-    border-radius:6px; padding:6px 10px;
-    font-size:13px; color:{_D_TEXT};
-}}
-QComboBox:focus {{ border:1.5px solid #60a5fa; }}
-QComboBox::drop-down {{ border:none; width:24px; }}
-QComboBox QAbstractItemView {{
-    background:{_D_SURFACE}; border:1px solid {_D_BORDER};
+}
+QScrollBar::handle:vertical {
+    background:${border}; min-height:24px; border-radius:3px;
+}
+QScrollBar::handle:vertical:hover { background:#475569; }
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical { height:0; }
+
+QComboBox::drop-down { border:none; width:24px; }
+QComboBox QAbstractItemView {
+    background:${surface}; border:1px solid ${border};
     selection-background-color:rgba(59,130,246,0.3);
-    color:{_D_TEXT}; padding:2px;
-}}
+    color:${text}; padding:2px;
+}
 
-QMenuBar {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT};
-    border-bottom: 1px solid {_D_BORDER};
+QMenuBar {
+    background: ${surface};
+    color: ${text};
+    border-bottom: 1px solid ${border};
     font-size: 13px;
-}}
-QMenuBar::item {{ padding:5px 10px; }}
-QMenuBar::item:selected {{ background:rgba(255,255,255,0.08); border-radius:4px; }}
-QMenu {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT};
-    border: 1px solid {_D_BORDER};
+}
+QMenuBar::item { padding:5px 10px; }
+QMenuBar::item:selected { background:rgba(255,255,255,0.08); border-radius:4px; }
+QMenu {
+    background: ${surface};
+    color: ${text};
+    border: 1px solid ${border};
     padding: 4px;
     border-radius: 6px;
-}}
-QMenu::item {{ padding:5px 18px; border-radius:4px; }}
-QMenu::item:selected {{ background:{PRIMARY}; color:#fff; }}
-QMenu::separator {{ height:1px; background:{_D_BORDER}; margin:4px 8px; }}
-
-QToolBar {{
-    background: {_D_SURFACE};
-    border-bottom: 1px solid {_D_BORDER};
+}
+QMenu::item { padding:5px 18px; border-radius:4px; }
+QMenu::item:selected { background:${primary}; color:#fff; }
+QMenu::separator { height:1px; background:${border}; margin:4px 8px; }
+
+QToolBar {
+    background: ${surface};
+    border-bottom: 1px solid ${border};
     spacing: 4px;
     padding: 3px 6px;
-}}
-QToolButton {{
+}
+QToolButton {
     background: transparent;
-    color: {_D_TEXT};
-    border: 1px solid {_D_BORDER};
+    color: ${text};
+    border: 1px solid ${border};
     border-radius: 5px;
     padding: 4px 10px;
     font-weight: 600;
     font-size: 12px;
     min-height: 24px;
     min-width: 44px;
-}}
-QToolButton:hover {{
+}
+QToolButton:hover {
     background: rgba(59,130,246,0.15);
     border-color: #60a5fa;
     color: #93c5fd;
-}}
-QToolButton:pressed, QToolButton:checked {{
-    background: {PRIMARY};
+}
+QToolButton:pressed, QToolButton:checked {
+    background: ${primary};
     color: #fff;
-    border-color: {PRIMARY};
-}}
+    border-color: ${primary};
+}
 
-QStatusBar {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT_DIM};
+QStatusBar {
+    background: ${surface};
+    color: ${text_dim};
     font-size: 12px;
-    border-top: 1px solid {_D_BORDER};
+    border-top: 1px solid ${border};
     padding: 2px 8px;
-}}
-
-QMessageBox {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT};
-}}
-QMessageBox QLabel {{
-    color: {_D_TEXT};
+}
+
+QMessageBox {
+    background: ${surface};
+    color: ${text};
+}
+QMessageBox QLabel {
+    color: ${text};
     font-size: 13px;
-}}
-QMessageBox QPushButton {{
+}
+QMessageBox QPushButton {
     min-width: 80px;
-}}
+}
 
-QDialog {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT};
-}}
+QDialog {
+    background: ${surface};
+    color: ${text};
+}
 
-QToolTip {{
-    background: {_D_SURFACE};
-    color: {_D_TEXT};
-    border: 1px solid {_D_BORDER};
+QToolTip {
+    background: ${surface};
+    color: ${text};
+    border: 1px solid ${border};
     padding: 4px 8px;
     font-size: 12px;
     border-radius: 4px;
-}}
+}
 """
 
-CARD_STYLE = f"""
+# Per theme: the sheet template and the palette that fills its ${slot}s
+_THEMES = {
+    "light": (_LIGHT_QSS, LIGHT),
+    "dark": (_DARK_QSS, DARK),
+}
+_FONT_SIZE = re.compile(r"font-size:\s*(\d+)px")
+
+
+def render_qss(template: Template, colors: Mapping[str, str]) -> str:
+    """Fill a stylesheet template's ${slot}s from a colour mapping."""
+    return template.substitute(colors)
+
+
+@functools.lru_cache(maxsize=4)
+def build_stylesheet(theme: Literal["light", "dark"] = "light", font_scale: float = 1.0) -> str:
+    """Render the global stylesheet for a theme, cached per (theme, font_scale).
+
+    A theme is only minified and rendered the first time it is asked for, so
+    light-only sessions never build the dark sheet.
+    """
+    source, palette = _THEMES[theme]
+    qss = render_qss(Template(_minify_qss(source)), {**asdict(palette), "font": FONT})
+    if font_scale != 1.0:
+        qss = _FONT_SIZE.sub(
+            lambda m: f"font-size:{round(int(m.group(1)) * font_scale)}px", qss
+        )
+    return qss
+
+
+GLOBAL_STYLESHEET: Final[str] = build_stylesheet("light")
+
+
+CARD_STYLE: Final[str] = _minify_qss(f"""
     background-color: {SURFACE};
     border: 1px solid {BORDER};
     border-radius: 8px;
     padding: 12px;
-"""
+""")
 
-CARD_STYLE_DARK = f"""
+CARD_STYLE_DARK: Final[str] = _minify_qss(f"""
     background-color: {_D_SURFACE};
     border: 1px solid {_D_BORDER};
     border-radius: 8px;
     padding: 12px;
-"""
+""")
 
-INFO_CARD_SUCCESS = f"""
+INFO_CARD_SUCCESS: Final[str] = _minify_qss(f"""
     background-color: {SUCCESS_LIGHT};
     border-left: 4px solid {SUCCESS};
     border-radius: 6px;
     padding: 12px 14px;
     color: #065f46;
-"""
+""")
 
-INFO_CARD_DANGER = f"""
+INFO_CARD_DANGER: Final[str] = _minify_qss(f"""
     background-color: {DANGER_LIGHT};
     border-left: 4px solid {DANGER};
     border-radius: 6px;
     padding: 12px 14px;
     color: #991b1b;
-"""
+""")
 
-INFO_CARD_WARNING = f"""
+INFO_CARD_WARNING: Final[str] = _minify_qss(f"""
     background-color: {WARNING_LIGHT};
     border-left: 4px solid {WARNING};
     border-radius: 6px;
     padding: 12px 14px;
     color: #92400e;
-"""
+""")
 
 # Dark-mode variants for info cards
-INFO_CARD_SUCCESS_DARK = f"""
+INFO_CARD_SUCCESS_DARK: Final[str] = _minify_qss(f"""
     background-color: #064e3b;
     border-left: 4px solid {SUCCESS};
     border-radius: 6px;
     padding: 12px 14px;
     color: #a7f3d0;
-"""
+""")
 
-INFO_CARD_DANGER_DARK = f"""
+INFO_CARD_DANGER_DARK: Final[str] = _minify_qss(f"""
     background-color: #7f1d1d;
     border-left: 4px solid {DANGER};
     border-radius: 6px;
     padding: 12px 14px;
     color: #fecaca;
-"""
+""")
 
-INFO_CARD_WARNING_DARK = f"""
+INFO_CARD_WARNING_DARK: Final[str] = _minify_qss(f"""
     background-color: #78350f;
     border-left: 4px solid {WARNING};
     border-radius: 6px;
     padding: 12px 14px;
     color: #fde68a;
-"""
+""")
+
+
+# (variant, dark) -> style, built once so lookups allocate nothing
+_INFO_CARD_STYLES = {
+    ('success', False): INFO_CARD_SUCCESS,
+    ('success', True): INFO_CARD_SUCCESS_DARK,
+    ('danger', False): INFO_CARD_DANGER,
+    ('danger', True): INFO_CARD_DANGER_DARK,
+    ('warning', False): INFO_CARD_WARNING,
+    ('warning', True): INFO_CARD_WARNING_DARK,
+}
 
 
 def get_info_card_style(variant: str, dark: bool) -> str:
@@ -744,10 +884,7 @@ def get_info_card_style(variant: str, dark: bool) -> str:
         variant: 'success', 'danger', or 'warning'
         dark: True for dark mode
     """
-    styles = {
-        'success': (INFO_CARD_SUCCESS, INFO_CARD_SUCCESS_DARK),
-        'danger': (INFO_CARD_DANGER, INFO_CARD_DANGER_DARK),
-        'warning': (INFO_CARD_WARNING, INFO_CARD_WARNING_DARK),
-    }
-    light, dark_style = styles.get(variant, (INFO_CARD_WARNING, INFO_CARD_WARNING_DARK))
-    return dark_style if dark else light
+    style = _INFO_CARD_STYLES.get((variant, bool(dark)))
+    if style is None:
+        style = INFO_CARD_WARNING_DARK if dark else INFO_CARD_WARNING
+    return style
@@ -2,33 +2,177 @@
 Break-Even Calculator tab for CSE Stock Analyzer GUI.
 """
 
+from collections import OrderedDict
+
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QLineEdit, QRadioButton, QCheckBox, QPushButton,
-    QTableWidget, QTableWidgetItem, QMessageBox
+    QTableView, QAbstractItemView, QHeaderView, QMessageBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QDoubleValidator, QIntValidator
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt6.QtGui import QDoubleValidator, QIntValidator, QValidator, QFont
 
 from src.calculations.breakeven import BreakEvenCalculator
-from gui.styles import (
-    INFO_CARD_SUCCESS, INFO_CARD_DANGER, INFO_CARD_WARNING,
-    TEXT_SECONDARY, TEXT_SECONDARY_DARK,
-    get_info_card_style
+from gui.styles import LIGHT, DARK, get_info_card_style
+
+
+_ROW_HEIGHT = 28
+_SECTION_GAP = 14
+_SECTION_ALIGN = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom
+
+
+class BreakEvenResultsModel(QAbstractTableModel):
+    """Read-only (metric, value) rows for the results table."""
+
+    _HEADERS = ("Metric", "Value")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._bold = set()
+        self._section = set()
+        # One shared bold font for every emphasised cell
+        self._bold_font = QFont(parent.font()) if parent is not None else QFont()
+        self._bold_font.setBold(True)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.FontRole and index.row() in self._bold:
+            return self._bold_font
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.row() in self._section:
+            return _SECTION_ALIGN
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
+    def set_rows(self, rows, bold_labels, section_labels=()):
+        """Update the rows in place; rows whose label is in ``bold_labels`` render bold.
+
+        Rows whose label is in ``section_labels`` align to the bottom of their
+        cell, so the view can make them taller to open a gap above a group.
+
+        Only rows whose text changed are signalled, and rows are inserted or
+        removed at the tail, so a recalculation repaints just the cells that
+        moved instead of resetting the whole view.
+        """
+        old, new = len(self._rows), len(rows)
+        if new < old:
+            self.beginRemoveRows(QModelIndex(), new, old - 1)
+            del self._rows[new:]
+            self.endRemoveRows()
+        elif new > old:
+            self.beginInsertRows(QModelIndex(), old, new - 1)
+            self._rows.extend(rows[old:])
+            self.endInsertRows()
+
+        bold = {i for i, (label, _) in enumerate(rows) if label in bold_labels}
+        section = {i for i, (label, _) in enumerate(rows) if label in section_labels}
+        changed = [i for i in range(min(old, new))
+                   if self._rows[i] != rows[i] or ((i in bold) != (i in self._bold))
+                   or ((i in section) != (i in self._section))]
+        self._rows[:min(old, new)] = rows[:min(old, new)]
+        self._bold = bold
+        self._section = section
+        if changed:
+            self.dataChanged.emit(self.index(changed[0], 0),
+                                  self.index(changed[-1], len(self._HEADERS) - 1))
+
+
+_RESULT_CACHE_SIZE = 128
+_CALC_DEBOUNCE_MS = 80
+_CURVE_POINTS = 256
+
+_BE_SUMMARY = (
+    "<div style='{style}'><b>Break-Even: LKR {be:.2f}</b><br>"
+    "Price increase: LKR {inc:.2f} ({pct:.2%})</div>"
 )
+_PROFIT_SUMMARY = (
+    "<div style='{style}'><b>{tag}: LKR {net:,.2f}</b><br>"
+    "Return: {pct:.2%} | BE: LKR {be:.2f}</div>"
+)
+
+
+def _pyqtgraph():
+    """Import pyqtgraph the first time a P&L curve is plotted."""
+    import pyqtgraph as pg
+    return pg
 
 
 class BreakEvenTab(QWidget):
     """Break-even calculator tab with profit/loss analysis."""
 
+    # (attribute prefix, label, placeholder, validator kind, hidden until profit mode)
+    _INPUT_SPEC = (
+        ("buy_price", "Purchase Price (LKR):", "e.g., 161.25", "price", False),
+        ("quantity", "Quantity (shares):", "e.g., 500", "int", False),
+        ("sell_price", "Selling Price (LKR):", "e.g., 170.00", "price", True),
+    )
+
+    _BOLD_LABELS = frozenset(("BREAK-EVEN PRICE", "NET PROFIT/LOSS"))
+    # Rows that open a new group get extra space above them
+    _SECTION_LABELS = frozenset((
+        "Total Investment", "BREAK-EVEN PRICE", "Sell Value at Break-Even",
+        "NET PROFIT/LOSS", "Break-Even Price",
+    ))
+
+    # (label, format) rows applied to the calculator's result dict
+    _BE_SCHEMA = (
+        ("Purchase Price", "LKR {buy_price:.2f}"),
+        ("Quantity", "{quantity:,} shares"),
+        ("Total Investment", "LKR {total_investment:,.2f}"),
+        ("Buy Fees Paid", "LKR {buy_fees_paid:,.2f}"),
+        ("BREAK-EVEN PRICE", "LKR {breakeven_price:.2f}"),
+        ("Price Increase Required", "LKR {price_increase_required:.2f}"),
+        ("Percentage Increase", "{price_increase_percentage:.2%}"),
+        ("Sell Value at Break-Even", "LKR {sell_value_at_breakeven:,.2f}"),
+        ("Sell Fees at Break-Even", "LKR {sell_fees_at_breakeven:,.2f}"),
+    )
+    _PL_SCHEMA = (
+        ("Purchase Price", "LKR {buy_price:.2f}"),
+        ("Selling Price", "LKR {sell_price:.2f}"),
+        ("Quantity", "{quantity:,} shares"),
+        ("Price Change", "LKR {price_change:.2f}"),
+        ("Total Investment", "LKR {total_investment:,.2f}"),
+        ("Total Fees Paid", "LKR {total_fees:,.2f}"),
+        ("Gross Profit/Loss", "LKR {gross_profit:,.2f}"),
+        ("Capital Gains Tax", "LKR {capital_gains_tax:,.2f}"),
+        ("NET PROFIT/LOSS", "LKR {net_profit:,.2f}"),
+        ("Return Percentage", "{profit_percentage:.2%}"),
+        ("Break-Even Price", "LKR {breakeven_price:.2f}"),
+        ("Above/Below BE", "LKR {price_vs_breakeven:.2f}"),
+    )
+
     def __init__(self):
         super().__init__()
         self.calculator = BreakEvenCalculator()
         self.is_dark = False
+        # Calculator results keyed on the input tuple, oldest evicted first
+        self._be_cache = OrderedDict()
+        self._pl_cache = OrderedDict()
+        # Bursts of Enter presses / clicks collapse into one calculation
+        self._calc_timer = QTimer(self)
+        self._calc_timer.setSingleShot(True)
+        self._calc_timer.setInterval(_CALC_DEBOUNCE_MS)
+        self._calc_timer.timeout.connect(self._do_calculate)
+        self._msg_box = None
         self.init_ui()
 
     def init_ui(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(14, 14, 14, 14)
 
@@ -38,7 +182,7 @@ class BreakEvenTab(QWidget):
 
         # Mode selection
         mode_group = QGroupBox("Calculation Mode")
-        mode_layout = QVBoxLayout()
+        mode_layout = QVBoxLayout(mode_group)
         mode_layout.setSpacing(4)
         mode_layout.setContentsMargins(10, 8, 10, 8)
 
@@ -49,7 +193,6 @@ class BreakEvenTab(QWidget):
 
         mode_layout.addWidget(self.mode_breakeven)
         mode_layout.addWidget(self.mode_profit)
-        mode_group.setLayout(mode_layout)
         main_layout.addWidget(mode_group)
 
         # Input / Output
@@ -60,42 +203,32 @@ class BreakEvenTab(QWidget):
         content_layout.addWidget(self.results_panel, 1)
         main_layout.addLayout(content_layout, 1)
 
-        self.setLayout(main_layout)
-
     # ── panels ────────────────────────────────────────────────────────
 
     def _build_input_panel(self):
         group = QGroupBox("Input Parameters")
-        grid = QGridLayout()
+        grid = QGridLayout(group)
         grid.setSpacing(8)
         grid.setContentsMargins(10, 14, 10, 10)
 
-        r = 0
-        grid.addWidget(QLabel("Purchase Price (LKR):"), r, 0)
-        self.buy_price_input = QLineEdit()
-        self.buy_price_input.setPlaceholderText("e.g., 161.25")
-        self.buy_price_input.setValidator(QDoubleValidator(0.01, 999999.99, 2))
-        self.buy_price_input.returnPressed.connect(self.calculate)
-        grid.addWidget(self.buy_price_input, r, 1)
-
-        r += 1
-        grid.addWidget(QLabel("Quantity (shares):"), r, 0)
-        self.quantity_input = QLineEdit()
-        self.quantity_input.setPlaceholderText("e.g., 500")
-        self.quantity_input.setValidator(QIntValidator(1, 99999999))
-        self.quantity_input.returnPressed.connect(self.calculate)
-        grid.addWidget(self.quantity_input, r, 1)
-
-        r += 1
-        self.sell_price_label = QLabel("Selling Price (LKR):")
-        self.sell_price_input = QLineEdit()
-        self.sell_price_input.setPlaceholderText("e.g., 170.00")
-        self.sell_price_input.setValidator(QDoubleValidator(0.01, 999999.99, 2))
-        self.sell_price_input.returnPressed.connect(self.calculate)
-        grid.addWidget(self.sell_price_label, r, 0)
-        grid.addWidget(self.sell_price_input, r, 1)
-        self.sell_price_label.hide()
-        self.sell_price_input.hide()
+        # Validators are shared by every field of the same kind
+        validators = {
+            "price": QDoubleValidator(0.01, 999999.99, 2, self),
+            "int": QIntValidator(1, 99999999, self),
+        }
+        for r, (name, label_text, placeholder, kind, hidden) in enumerate(self._INPUT_SPEC):
+            label = QLabel(label_text)
+            field = QLineEdit()
+            field.setPlaceholderText(placeholder)
+            field.setValidator(validators[kind])
+            field.returnPressed.connect(self.calculate)
+            grid.addWidget(label, r, 0)
+            grid.addWidget(field, r, 1)
+            setattr(self, f"{name}_input", field)
+            if hidden:
+                setattr(self, f"{name}_label", label)
+                label.hide()
+                field.hide()
 
         r += 1
         self.include_tax_checkbox = QCheckBox("Include Capital Gains Tax (30%)")
@@ -107,6 +240,12 @@ class BreakEvenTab(QWidget):
         self.calculate_btn.clicked.connect(self.calculate)
         grid.addWidget(self.calculate_btn, r, 0, 1, 2)
 
+        r += 1
+        plot_btn = QPushButton("Plot P&&L")
+        plot_btn.setProperty("buttonStyle", "secondary")
+        plot_btn.clicked.connect(self.plot_profit_curve)
+        grid.addWidget(plot_btn, r, 0, 1, 2)
+
         r += 1
         clear_btn = QPushButton("Clear")
         clear_btn.setProperty("buttonStyle", "secondary")
@@ -114,34 +253,26 @@ class BreakEvenTab(QWidget):
         grid.addWidget(clear_btn, r, 0, 1, 2)
 
         grid.setRowStretch(r + 1, 1)
-        group.setLayout(grid)
         return group
 
     def _build_results_panel(self):
         group = QGroupBox("Results")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
         self.results_label = QLabel("Enter values and click Calculate to see results")
         self.results_label.setWordWrap(True)
         self.results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.results_label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 12px; padding: 12px;")
+        self.results_label.setProperty("role", "placeholder")
         layout.addWidget(self.results_label)
 
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(2)
-        self.results_table.setHorizontalHeaderLabels(["Metric", "Value"])
-        self.results_table.horizontalHeader().setStretchLastSection(True)
-        self.results_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.results_table.setAlternatingRowColors(True)
-        self.results_table.verticalHeader().setVisible(False)
-        self.results_table.verticalHeader().setDefaultSectionSize(28)
-        self.results_table.setShowGrid(False)
-        self.results_table.hide()
-        layout.addWidget(self.results_table)
+        # The table is created on the first calculation
+        self.results_model = None
+        self.results_table = None
+        self.pnl_plot = None
+        self._results_layout = layout
 
-        group.setLayout(layout)
         return group
 
     # ── logic ─────────────────────────────────────────────────────────
@@ -153,122 +284,213 @@ class BreakEvenTab(QWidget):
             self.sell_price_label.hide(); self.sell_price_input.hide()
 
     def calculate(self):
+        """Schedule a calculation; restarting the timer absorbs repeat triggers."""
+        self._calc_timer.start()
+
+    def _do_calculate(self):
         try:
-            if not self.buy_price_input.text() or not self.quantity_input.text():
-                self._show_msg(QMessageBox.Icon.Warning, "Input Required",
-                    "Please enter both purchase price and quantity.")
+            values = self._read_purchase()
+            if values is None:
                 return
-            buy_price = float(self.buy_price_input.text())
-            quantity = int(self.quantity_input.text())
+            buy_price, quantity = values
             include_tax = self.include_tax_checkbox.isChecked()
 
             if self.mode_profit.isChecked():
-                if not self.sell_price_input.text():
-                    self._show_msg(QMessageBox.Icon.Warning, "Input Required", "Please enter selling price.")
+                values = self._read_inputs(
+                    ((self.sell_price_input, "Selling price"),), "Please enter selling price.")
+                if values is None:
                     return
-                sell_price = float(self.sell_price_input.text())
-                result = self.calculator.calculate_profit_at_price(buy_price, sell_price, quantity, include_tax)
+                sell_price, = values
+                result = self._cached(self._pl_cache, self.calculator.calculate_profit_at_price,
+                                      buy_price, sell_price, quantity, include_tax)
                 self._show_profit_results(result)
             else:
-                result = self.calculator.calculate_breakeven_price(buy_price, quantity, include_tax)
+                result = self._cached(self._be_cache, self.calculator.calculate_breakeven_price,
+                                      buy_price, quantity, include_tax)
                 self._show_breakeven_results(result)
         except ValueError as e:
-            self._show_msg(QMessageBox.Icon.Critical, "Calculation Error", f"Invalid input: {e}")
+            self._show_msg(QMessageBox.Icon.Critical, "Calculation Error", str(e))
+        except Exception as e:
+            self._show_msg(QMessageBox.Icon.Critical, "Error", str(e))
+
+    def plot_profit_curve(self):
+        """Plot net P&L for sell prices from 50% to 150% of the purchase price."""
+        try:
+            values = self._read_purchase()
+            if values is None:
+                return
+            buy_price, quantity = values
+            sell_prices = np.linspace(0.5 * buy_price, 1.5 * buy_price, _CURVE_POINTS)
+            curve = self.calculator.calculate_profit_curve(
+                buy_price, quantity, self.include_tax_checkbox.isChecked(), sell_prices)
+
+            self._ensure_pnl_plot()
+            self._pnl_curve.setData(curve['sell_price'], curve['net_profit'])
+            self.pnl_plot.show()
+        except ValueError as e:
+            self._show_msg(QMessageBox.Icon.Critical, "Calculation Error", str(e))
         except Exception as e:
             self._show_msg(QMessageBox.Icon.Critical, "Error", str(e))
 
+    def _ensure_pnl_plot(self):
+        if self.pnl_plot is None:
+            pg = _pyqtgraph()
+            self.pnl_plot = pg.PlotWidget()
+            self.pnl_plot.setMinimumHeight(180)
+            self.pnl_plot.showGrid(x=True, y=True, alpha=0.3)
+            self.pnl_plot.setLabel("bottom", "Selling Price (LKR)")
+            # Both items are reused; replotting only swaps the curve data
+            self._pnl_zero = self.pnl_plot.addLine(y=0)
+            self._pnl_curve = self.pnl_plot.plot()
+            self._apply_plot_theme()
+            self._results_layout.addWidget(self.pnl_plot, 1)
+
+    def _apply_plot_theme(self):
+        pg = _pyqtgraph()
+        palette = DARK if self.is_dark else LIGHT
+        self.pnl_plot.setBackground(palette.surface)
+        self.pnl_plot.setTitle("Net P&L (LKR)", color=palette.text_dim, size="9pt")
+        axis_pen = pg.mkPen(palette.text_dim)
+        for name in ("bottom", "left"):
+            axis = self.pnl_plot.getAxis(name)
+            axis.setPen(axis_pen)
+            axis.setTextPen(axis_pen)
+        self._pnl_zero.setPen(axis_pen)
+        self._pnl_curve.setPen(pg.mkPen(palette.primary, width=2))
+
+    @staticmethod
+    def _read_number(field):
+        """Parse ``field`` with its validator's locale; None unless the validator accepts it."""
+        validator = field.validator()
+        text = field.text()
+        if validator.validate(text, 0)[0] != QValidator.State.Acceptable:
+            return None
+        if isinstance(validator, QIntValidator):
+            value, ok = validator.locale().toInt(text)
+        else:
+            value, ok = validator.locale().toDouble(text)
+        return value if ok else None
+
+    def _read_purchase(self):
+        """Purchase price and quantity, or None after warning; shared by calculate and plot."""
+        return self._read_inputs(
+            ((self.buy_price_input, "Purchase price"), (self.quantity_input, "Quantity")),
+            "Please enter both purchase price and quantity.")
+
+    def _read_inputs(self, fields, missing_msg):
+        """Read the ``(field, name)`` pairs; None after warning about the first bad one.
+
+        An empty field shows ``missing_msg``; text the validator rejects, such
+        as zero or a value past its top, shows the range the field accepts.
+        """
+        if not all(field.text() for field, _ in fields):
+            self._show_msg(QMessageBox.Icon.Warning, "Input Required", missing_msg)
+            return None
+        values = []
+        for field, name in fields:
+            value = self._read_number(field)
+            if value is None:
+                validator = field.validator()
+                locale = validator.locale()
+                if isinstance(validator, QIntValidator):
+                    low, high = locale.toString(validator.bottom()), locale.toString(validator.top())
+                else:
+                    decimals = validator.decimals()
+                    low = locale.toString(validator.bottom(), "f", decimals)
+                    high = locale.toString(validator.top(), "f", decimals)
+                self._show_msg(QMessageBox.Icon.Warning, "Invalid Input",
+                    f"{name} must be between {low} and {high}.")
+                return None
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _cached(cache, func, *args):
+        """Return ``func(*args)``, memoized in the bounded ``cache``."""
+        result = cache.get(args)
+        if result is None:
+            result = func(*args)
+            cache[args] = result
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(args)
+        return result
+
     # ── display helpers ───────────────────────────────────────────────
 
+    def _ensure_results_table(self):
+        if self.results_table is not None:
+            return
+        self.results_model = BreakEvenResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        # The header sizes the columns itself as rows change
+        header = self.results_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        self.results_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.verticalHeader().setDefaultSectionSize(_ROW_HEIGHT)
+        self.results_table.setShowGrid(False)
+        self._results_layout.addWidget(self.results_table, 1)
+
     def _populate_table(self, data):
-        self.results_table.setRowCount(0)
+        self._ensure_results_table()
+        self.results_model.set_rows(data, self._BOLD_LABELS, self._SECTION_LABELS)
+        for row, (label, _) in enumerate(data):
+            gap = _SECTION_GAP if label in self._SECTION_LABELS else 0
+            self.results_table.setRowHeight(row, _ROW_HEIGHT + gap)
         self.results_table.show()
-        for label, value in data:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            i1, i2 = QTableWidgetItem(label), QTableWidgetItem(value)
-            if label in ("BREAK-EVEN PRICE", "NET PROFIT/LOSS"):
-                f = i1.font(); f.setBold(True); i1.setFont(f); i2.setFont(f)
-            self.results_table.setItem(row, 0, i1)
-            self.results_table.setItem(row, 1, i2)
-        self.results_table.resizeColumnsToContents()
 
     def _show_breakeven_results(self, r):
-        data = [
-            ("Purchase Price", f"LKR {r['buy_price']:.2f}"),
-            ("Quantity", f"{r['quantity']:,} shares"),
-            ("", ""),
-            ("Total Investment", f"LKR {r['total_investment']:,.2f}"),
-            ("Buy Fees Paid", f"LKR {r['buy_fees_paid']:,.2f}"),
-            ("", ""),
-            ("BREAK-EVEN PRICE", f"LKR {r['breakeven_price']:.2f}"),
-            ("Price Increase Required", f"LKR {r['price_increase_required']:.2f}"),
-            ("Percentage Increase", f"{r['price_increase_percentage'] * 100:.2f}%"),
-            ("", ""),
-            ("Sell Value at Break-Even", f"LKR {r['sell_value_at_breakeven']:,.2f}"),
-            ("Sell Fees at Break-Even", f"LKR {r['sell_fees_at_breakeven']:,.2f}"),
-        ]
+        data = [(label, fmt.format_map(r)) for label, fmt in self._BE_SCHEMA]
         if r['includes_capital_gains_tax']:
             data.append(("Capital Gains Tax", "Yes (30%)"))
         self._populate_table(data)
-        self.results_label.setText(
-            f"<div style='{get_info_card_style('success', self.is_dark)}'>"
-            f"<b>Break-Even: LKR {r['breakeven_price']:.2f}</b><br>"
-            f"Price increase: LKR {r['price_increase_required']:.2f} "
-            f"({r['price_increase_percentage'] * 100:.2f}%)</div>"
-        )
+        self.results_label.setText(_BE_SUMMARY.format(
+            style=get_info_card_style('success', self.is_dark),
+            be=r['breakeven_price'], inc=r['price_increase_required'],
+            pct=r['price_increase_percentage'],
+        ))
 
     def _show_profit_results(self, r):
         is_profit = r['net_profit'] > 0
-        data = [
-            ("Purchase Price", f"LKR {r['buy_price']:.2f}"),
-            ("Selling Price", f"LKR {r['sell_price']:.2f}"),
-            ("Quantity", f"{r['quantity']:,} shares"),
-            ("Price Change", f"LKR {r['sell_price'] - r['buy_price']:.2f}"),
-            ("", ""),
-            ("Total Investment", f"LKR {r['total_investment']:,.2f}"),
-            ("Total Fees Paid", f"LKR {r['total_fees']:,.2f}"),
-            ("Gross Profit/Loss", f"LKR {r['gross_profit']:,.2f}"),
-            ("Capital Gains Tax", f"LKR {r['capital_gains_tax']:,.2f}"),
-            ("", ""),
-            ("NET PROFIT/LOSS", f"LKR {r['net_profit']:,.2f}"),
-            ("Return Percentage", f"{r['profit_percentage'] * 100:.2f}%"),
-            ("", ""),
-            ("Break-Even Price", f"LKR {r['breakeven_price']:.2f}"),
-            ("Above/Below BE", f"LKR {r['price_vs_breakeven']:.2f}"),
-        ]
+        fields = dict(r, price_change=r['sell_price'] - r['buy_price'])
+        data = [(label, fmt.format_map(fields)) for label, fmt in self._PL_SCHEMA]
         self._populate_table(data)
-        style = get_info_card_style('success', self.is_dark) if is_profit else get_info_card_style('danger', self.is_dark)
-        tag = "PROFIT" if is_profit else "LOSS"
-        self.results_label.setText(
-            f"<div style='{style}'>"
-            f"<b>{tag}: LKR {r['net_profit']:,.2f}</b><br>"
-            f"Return: {r['profit_percentage'] * 100:.2f}% | "
-            f"BE: LKR {r['breakeven_price']:.2f}</div>"
-        )
+        self.results_label.setText(_PROFIT_SUMMARY.format(
+            style=get_info_card_style('success' if is_profit else 'danger', self.is_dark),
+            tag="PROFIT" if is_profit else "LOSS",
+            net=r['net_profit'], pct=r['profit_percentage'], be=r['breakeven_price'],
+        ))
 
     def clear_inputs(self):
+        self._calc_timer.stop()
         self.buy_price_input.clear()
         self.quantity_input.clear()
         self.sell_price_input.clear()
         self.include_tax_checkbox.setChecked(True)
         self.mode_breakeven.setChecked(True)
-        self.results_table.hide()
+        self._be_cache.clear()
+        self._pl_cache.clear()
+        if self.results_table is not None:
+            self.results_table.hide()
+        if self.pnl_plot is not None:
+            self.pnl_plot.hide()
         self.results_label.setText("Enter values and click Calculate to see results")
-        self._update_results_label_style()
-
-    def _update_results_label_style(self):
-        c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
-        self.results_label.setStyleSheet(f"color: {c}; font-size: 12px; padding: 12px;")
 
     def apply_theme(self, dark_mode: bool):
         self.is_dark = dark_mode
-        self._update_results_label_style()
+        if self.pnl_plot is not None:
+            self._apply_plot_theme()
 
     def _show_msg(self, icon, title, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(icon)
-        if self.is_dark:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        # One box reused for every message; the application stylesheet themes it
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.setIcon(icon)
+        self._msg_box.exec()
@@ -3,6 +3,12 @@ Complete Analysis tab for CSE Stock Analyzer GUI.
 Combines fundamental + technical + risk analysis into a single dashboard.
 """
 
+import hashlib
+import re
+from collections import OrderedDict
+
+import numpy as np
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox,
     QFrame, QGridLayout, QScrollArea, QGroupBox, QLineEdit, QTextEdit,
@@ -12,8 +18,7 @@ from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QDoubleValidator
 
 from gui.styles import (
-    CARD_STYLE, CARD_STYLE_DARK, TEXT_SECONDARY, TEXT_SECONDARY_DARK,
-    SUCCESS, WARNING, DANGER, TEXT, _D_TEXT, _D_SURFACE, _D_BORDER, _D_BG,
+    SUCCESS, WARNING, DANGER, _D_SURFACE, _D_BORDER,
     get_info_card_style
 )
 
@@ -23,41 +28,103 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# One closing price per line; lines that are not a plain number are skipped
+_PRICE_LINE = re.compile(
+    r"^[^\S\n]*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)[^\S\n]*$", re.M
+)
+
+# "Load Sample Prices" text: 40 closes, oldest first
+_SAMPLE_PRICES_TEXT = "\n".join(f"{p:.2f}" for p in (
+    150.00, 152.50, 151.00, 153.75, 155.00, 154.25, 156.50, 158.00,
+    157.00, 159.25, 160.50, 161.00, 160.25, 162.00, 163.50, 162.75,
+    164.00, 165.50, 164.25, 166.00, 167.50, 168.00, 167.25, 169.00,
+    170.50, 169.75, 171.00, 172.50, 171.25, 173.00, 174.50, 173.75,
+    175.00, 176.50, 175.25, 177.00, 178.50, 177.75, 179.00, 180.50,
+))
+
+# Recent results kept per input digest, so re-running unchanged inputs is instant
+_RESULT_CACHE_SIZE = 32
+
+# Score colour bands as (minimum score, colour); anything lower is DANGER
+_SCORE_BANDS = ((70, SUCCESS), (50, WARNING))
+# Score label stylesheets per band colour, for the overall and card scores
+_SCORE_STYLE = {
+    color: f"font-size: 42px; font-weight: bold; color: {color};"
+    for color in (SUCCESS, WARNING, DANGER)
+}
+_CARD_SCORE_STYLE = {
+    color: f"font-size: 22px; font-weight: bold; color: {color};"
+    for color in (SUCCESS, WARNING, DANGER)
+}
+
 
 class _AnalysisWorker(QThread):
-    """Background worker that runs the recommendation engine off the main thread."""
+    """Background worker that runs the recommendation engine and saves its result off the main thread."""
 
     finished = pyqtSignal(dict)   # emits the result dict
     error = pyqtSignal(str)       # emits the error message
+    saved = pyqtSignal(int)       # emits the history row id, -1 if the save failed
 
-    def __init__(self, engine, stock_data, prices=None):
+    def __init__(self, engine, db, stock_data, prices=None):
         super().__init__()
         self.engine = engine
+        self.db = db
         self.stock_data = stock_data
         self.prices = prices
 
     def run(self):
         try:
             result = self.engine.generate_recommendation(
-                self.stock_data, prices=self.prices if self.prices else None
+                self.stock_data, prices=self.prices
             )
-            self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
+            return
+        # The dashboard fills in while the row is written
+        self.finished.emit(result)
+        row_id = -1
+        try:
+            row_id = self.db.save_analysis(result)
+        except Exception as e:
+            logger.error(f"Failed to autosave analysis: {e}")
+        finally:
+            # Always answer, so the tab re-enables its button
+            self.saved.emit(row_id)
 
 
 class CompleteAnalysisTab(QWidget):
     """Complete stock analysis dashboard with user input."""
 
+    analysis_saved = pyqtSignal()  # emitted after a result is written to the database
+
+    # Fundamental line edits, in form order
+    _INPUT_ATTRS = (
+        "symbol_input", "price_input", "eps_input", "book_value_input",
+        "net_income_input", "equity_input", "debt_input",
+        "current_assets_input", "current_liabilities_input",
+    )
+    # Optional figures as (input, stock_data key, scale); amounts are entered in millions
+    _FIELD_SPEC = (
+        ("book_value_input", "book_value_per_share", 1),
+        ("net_income_input", "net_income", 1e6),
+        ("equity_input", "shareholders_equity", 1e6),
+        ("debt_input", "total_debt", 1e6),
+        ("current_assets_input", "current_assets", 1e6),
+        ("current_liabilities_input", "current_liabilities", 1e6),
+    )
+
     def __init__(self):
         super().__init__()
         self.is_dark = False
+        self._msg_box = None
+        self._result_cache = OrderedDict()
+        self._pending_key = None
         self.engine = RecommendationEngine()
         self.db = AnalysisDatabase()
         self.init_ui()
 
     def init_ui(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(14, 14, 14, 14)
 
@@ -79,7 +146,7 @@ class CompleteAnalysisTab(QWidget):
 
         # Fundamental inputs
         fund_group = QGroupBox("Fundamental Data")
-        fund_grid = QGridLayout()
+        fund_grid = QGridLayout(fund_group)
         fund_grid.setSpacing(6)
         fund_grid.setContentsMargins(10, 14, 10, 10)
 
@@ -95,28 +162,32 @@ class CompleteAnalysisTab(QWidget):
             ("Current Liabilities (Mn):", "current_liabilities_input", "e.g., 8000", (0.01, 999999999.99)),
         ]
 
+        # Validators are shared by every field with the same range
+        validators = {}
         for r, (label, attr, placeholder, validator_range) in enumerate(fund_fields):
             fund_grid.addWidget(QLabel(label), r, 0)
             inp = QLineEdit()
             inp.setPlaceholderText(placeholder)
             if validator_range:
-                inp.setValidator(QDoubleValidator(validator_range[0], validator_range[1], 2))
+                if validator_range not in validators:
+                    validators[validator_range] = QDoubleValidator(*validator_range, 2, self)
+                inp.setValidator(validators[validator_range])
             setattr(self, attr, inp)
             fund_grid.addWidget(inp, r, 1)
 
-        fund_group.setLayout(fund_grid)
         input_layout.addWidget(fund_group)
 
         # Technical inputs (price history)
         tech_group = QGroupBox("Price History (for Technical Analysis)")
-        tech_layout = QVBoxLayout()
+        tech_layout = QVBoxLayout(tech_group)
         tech_layout.setSpacing(6)
         tech_layout.setContentsMargins(10, 14, 10, 10)
 
         self.price_hint = QLabel("Enter historical closing prices, one per line (oldest first).\n"
                             "Need at least 35 prices for full analysis.")
+        self.price_hint.setTextFormat(Qt.TextFormat.PlainText)
         self.price_hint.setWordWrap(True)
-        self.price_hint.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 11px;")
+        self.price_hint.setProperty("role", "caption")
         tech_layout.addWidget(self.price_hint)
 
         self.prices_input = QTextEdit()
@@ -132,7 +203,6 @@ class CompleteAnalysisTab(QWidget):
         sample_btn.clicked.connect(self._load_sample_prices)
         tech_layout.addWidget(sample_btn)
 
-        tech_group.setLayout(tech_layout)
         input_layout.addWidget(tech_group)
 
         # Action buttons
@@ -168,21 +238,36 @@ class CompleteAnalysisTab(QWidget):
             "\"Run Complete Analysis\" to see results."
         )
         self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.placeholder_label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 13px; padding: 40px;")
+        self.placeholder_label.setProperty("role", "placeholder")
         self.results_layout.addWidget(self.placeholder_label)
 
-        # Score + Recommendation (hidden initially)
+        # Score, cards and insights are built on the first analysis
+        self.top_frame = None
+
+        self.results_layout.addStretch()
+        results_scroll.setWidget(self.results_widget)
+        splitter.addWidget(results_scroll)
+
+        splitter.setSizes([400, 600])
+        main_layout.addWidget(splitter, 1)
+
+    # ── Results dashboard ──────────────────────────────────
+    def _ensure_results_built(self):
+        """Build the score, card and insight widgets the first time results are shown."""
+        if self.top_frame is not None:
+            return
+
+        # Score + Recommendation
         self.top_frame = QFrame()
-        self.top_frame.setStyleSheet(CARD_STYLE)
+        self.top_frame.setProperty("role", "card")
         top_layout = QHBoxLayout(self.top_frame)
 
         score_col = QVBoxLayout()
         self.score_value = QLabel("--")
         self.score_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.score_value.setStyleSheet(f"font-size: 42px; font-weight: bold; color: {TEXT};")
         self.score_title = QLabel("OVERALL SCORE")
         self.score_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.score_title.setStyleSheet(f"font-size: 10px; font-weight: bold; color: {TEXT_SECONDARY}; letter-spacing: 1px;")
+        self.score_title.setProperty("role", "card-title")
         score_col.addWidget(self.score_value)
         score_col.addWidget(self.score_title)
 
@@ -193,18 +278,16 @@ class CompleteAnalysisTab(QWidget):
         rec_col = QVBoxLayout()
         self.rec_value = QLabel("--")
         self.rec_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.rec_value.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {TEXT};")
+        self.rec_value.setProperty("role", "recommendation")
         self.conf_value = QLabel("")
         self.conf_value.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.conf_value.setStyleSheet(f"font-size: 12px; color: {TEXT_SECONDARY}; background: #e0f2fe; padding: 3px 10px; border-radius: 10px;")
+        self.conf_value.setProperty("role", "confidence")
         rec_col.addWidget(self.rec_value)
         rec_col.addWidget(self.conf_value, 0, Qt.AlignmentFlag.AlignCenter)
 
         top_layout.addLayout(score_col, 1)
         top_layout.addWidget(sep)
         top_layout.addLayout(rec_col, 2)
-        self.top_frame.hide()
-        self.results_layout.addWidget(self.top_frame)
 
         # Breakdown cards row
         self.cards_widget = QWidget()
@@ -212,14 +295,14 @@ class CompleteAnalysisTab(QWidget):
         cards_layout.setContentsMargins(0, 0, 0, 0)
         cards_layout.setSpacing(10)
 
+        # prefix -> (title, score, caption) labels of each card
+        self._card_labels = {}
         self.fund_card = self._make_card("FUNDAMENTAL")
         self.tech_card = self._make_card("TECHNICAL")
         self.risk_card = self._make_card("RISK")
         cards_layout.addWidget(self.fund_card)
         cards_layout.addWidget(self.tech_card)
         cards_layout.addWidget(self.risk_card)
-        self.cards_widget.hide()
-        self.results_layout.addWidget(self.cards_widget)
 
         # Strengths & Concerns
         self.insights_widget = QWidget()
@@ -228,24 +311,26 @@ class CompleteAnalysisTab(QWidget):
         insights_layout.setSpacing(10)
 
         self.strengths_frame = QFrame()
-        self.strengths_frame.setStyleSheet(CARD_STYLE)
+        self.strengths_frame.setProperty("role", "card")
         s_layout = QVBoxLayout(self.strengths_frame)
         self.strengths_title = QLabel("✅ Key Strengths")
         self.strengths_title.setStyleSheet(f"color: {SUCCESS}; font-weight: bold; font-size: 13px;")
         self.strengths_label = QLabel("—")
         self.strengths_label.setWordWrap(True)
+        self.strengths_label.setProperty("role", "insight")
         self.strengths_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         s_layout.addWidget(self.strengths_title)
         s_layout.addWidget(self.strengths_label)
         s_layout.addStretch()
 
         self.concerns_frame = QFrame()
-        self.concerns_frame.setStyleSheet(CARD_STYLE)
+        self.concerns_frame.setProperty("role", "card")
         c_layout = QVBoxLayout(self.concerns_frame)
         self.concerns_title = QLabel("⚠ Key Concerns")
         self.concerns_title.setStyleSheet(f"color: {DANGER}; font-weight: bold; font-size: 13px;")
         self.concerns_label = QLabel("—")
         self.concerns_label.setWordWrap(True)
+        self.concerns_label.setProperty("role", "insight")
         self.concerns_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         c_layout.addWidget(self.concerns_title)
         c_layout.addWidget(self.concerns_label)
@@ -253,94 +338,78 @@ class CompleteAnalysisTab(QWidget):
 
         insights_layout.addWidget(self.strengths_frame)
         insights_layout.addWidget(self.concerns_frame)
-        self.insights_widget.hide()
-        self.results_layout.addWidget(self.insights_widget)
 
         # Action Items
         self.actions_frame = QFrame()
-        self.actions_frame.setStyleSheet(CARD_STYLE)
+        self.actions_frame.setProperty("role", "card")
         act_layout = QVBoxLayout(self.actions_frame)
         self.act_title = QLabel("📋 Action Items")
-        self.act_title.setStyleSheet(f"font-weight: bold; font-size: 13px;")
+        self.act_title.setProperty("role", "insight-title")
         self.actions_label = QLabel("—")
         self.actions_label.setWordWrap(True)
+        self.actions_label.setProperty("role", "insight")
         act_layout.addWidget(self.act_title)
         act_layout.addWidget(self.actions_label)
-        self.actions_frame.hide()
-        self.results_layout.addWidget(self.actions_frame)
-
-        self.results_layout.addStretch()
-        results_scroll.setWidget(self.results_widget)
-        splitter.addWidget(results_scroll)
 
-        splitter.setSizes([400, 600])
-        main_layout.addWidget(splitter, 1)
-        self.setLayout(main_layout)
+        # Above the stretch that keeps the dashboard top-aligned
+        at = self.results_layout.count() - 1
+        for i, widget in enumerate((self.top_frame, self.cards_widget,
+                                    self.insights_widget, self.actions_frame)):
+            self.results_layout.insertWidget(at + i, widget)
 
     # ── Helper: Create a mini score card ───────────────────
     def _make_card(self, title):
         frame = QFrame()
-        frame.setStyleSheet(CARD_STYLE)
+        frame.setProperty("role", "card")
         layout = QVBoxLayout(frame)
         layout.setSpacing(4)
 
         t = QLabel(title)
         t.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        t.setStyleSheet(f"font-size: 10px; font-weight: bold; color: {TEXT_SECONDARY}; letter-spacing: 1px;")
-        t.setObjectName(f"{title.lower()}_card_title")
+        t.setProperty("role", "card-title")
 
         v = QLabel("--")
-        v.setObjectName(f"{title.lower()}_score_val")
         v.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        v.setStyleSheet(f"font-size: 22px; font-weight: bold; color: {TEXT};")
 
         lbl = QLabel("")
-        lbl.setObjectName(f"{title.lower()}_score_lbl")
         lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        lbl.setStyleSheet(f"font-size: 11px; color: {TEXT_SECONDARY};")
+        lbl.setProperty("role", "caption")
 
         layout.addWidget(t)
         layout.addWidget(v)
         layout.addWidget(lbl)
+        self._card_labels[title.lower()] = (t, v, lbl)
         return frame
 
     # ── Load sample prices ─────────────────────────────────
     def _load_sample_prices(self):
-        sample = [
-            150.00, 152.50, 151.00, 153.75, 155.00, 154.25, 156.50, 158.00,
-            157.00, 159.25, 160.50, 161.00, 160.25, 162.00, 163.50, 162.75,
-            164.00, 165.50, 164.25, 166.00, 167.50, 168.00, 167.25, 169.00,
-            170.50, 169.75, 171.00, 172.50, 171.25, 173.00, 174.50, 173.75,
-            175.00, 176.50, 175.25, 177.00, 178.50, 177.75, 179.00, 180.50
-        ]
-        self.prices_input.setPlainText("\n".join(f"{p:.2f}" for p in sample))
+        self.prices_input.setPlainText(_SAMPLE_PRICES_TEXT)
 
     # ── Parse prices from text ─────────────────────────────
     def _parse_prices(self):
-        text = self.prices_input.toPlainText().strip()
-        if not text:
-            return []
-        prices = []
-        for line in text.split("\n"):
-            line = line.strip()
-            if line:
-                try:
-                    prices.append(float(line))
-                except ValueError:
-                    pass  # skip non-numeric lines
-        return prices
+        return np.array(_PRICE_LINE.findall(self.prices_input.toPlainText()), dtype=np.float64)
+
+    @staticmethod
+    def _result_key(stock_data, prices):
+        """Digest of one run's inputs, used as the result cache key."""
+        digest = hashlib.blake2b(repr(sorted(stock_data.items())).encode(), digest_size=16)
+        digest.update(prices.tobytes())
+        return digest.digest()
 
     # ── Run the analysis ───────────────────────────────────
     def run_analysis(self):
+        # Read every field once
+        raw = {attr: getattr(self, attr).text().strip() for attr in self._INPUT_ATTRS}
+
         # Validate minimum required inputs
-        if not self.price_input.text() or not self.eps_input.text():
+        if not raw["price_input"] or not raw["eps_input"]:
             self._show_msg("Input Required",
                            "Please enter at least Current Price and EPS to run analysis.")
             return
 
         try:
-            price = float(self.price_input.text())
-            eps = float(self.eps_input.text())
+            price = float(raw["price_input"])
+            eps = float(raw["eps_input"])
         except ValueError:
             self._show_msg("Invalid Input", "Price and EPS must be valid numbers.")
             return
@@ -351,80 +420,67 @@ class CompleteAnalysisTab(QWidget):
             'eps': eps,
         }
 
-        if self.symbol_input.text().strip():
-            stock_data['ticker'] = self.symbol_input.text().strip()
-
-        if self.book_value_input.text():
-            try:
-                stock_data['book_value_per_share'] = float(self.book_value_input.text())
-            except ValueError:
-                pass
-
-        if self.net_income_input.text():
-            try:
-                stock_data['net_income'] = float(self.net_income_input.text()) * 1e6
-            except ValueError:
-                pass
-
-        if self.equity_input.text():
-            try:
-                stock_data['shareholders_equity'] = float(self.equity_input.text()) * 1e6
-            except ValueError:
-                pass
-
-        if self.debt_input.text():
-            try:
-                stock_data['total_debt'] = float(self.debt_input.text()) * 1e6
-            except ValueError:
-                pass
-
-        if self.current_assets_input.text():
-            try:
-                stock_data['current_assets'] = float(self.current_assets_input.text()) * 1e6
-            except ValueError:
-                pass
-
-        if self.current_liabilities_input.text():
-            try:
-                stock_data['current_liabilities'] = float(self.current_liabilities_input.text()) * 1e6
-            except ValueError:
-                pass
-
-        # Derived values the engine may need
-        if 'total_debt' in stock_data and 'shareholders_equity' in stock_data:
-            stock_data['debt_to_equity_ratio'] = stock_data['total_debt'] / stock_data['shareholders_equity']
-
-        if 'current_assets' in stock_data and 'current_liabilities' in stock_data:
-            stock_data['current_ratio'] = stock_data['current_assets'] / stock_data['current_liabilities']
+        if raw["symbol_input"]:
+            stock_data['ticker'] = raw["symbol_input"]
+
+        for attr, key, scale in self._FIELD_SPEC:
+            if raw[attr]:
+                try:
+                    stock_data[key] = float(raw[attr]) * scale
+                except ValueError:
+                    continue
+
+        # Derived values the engine may need; a zero denominator leaves the ratio out
+        debt, equity = stock_data.get('total_debt'), stock_data.get('shareholders_equity')
+        if debt is not None and equity:
+            stock_data['debt_to_equity_ratio'] = debt / equity
+
+        assets, liabilities = stock_data.get('current_assets'), stock_data.get('current_liabilities')
+        if assets is not None and liabilities:
+            stock_data['current_ratio'] = assets / liabilities
 
         # Parse historical prices
         prices = self._parse_prices()
 
+        key = self._result_key(stock_data, prices)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            # Already analysed and saved; just show it again
+            self._result_cache.move_to_end(key)
+            self._display_results(cached)
+            return
+        self._pending_key = key
+
         # Disable button and show progress
         self.analyze_btn.setEnabled(False)
         self.analyze_btn.setText("Analyzing...")
 
         # Run the engine on a background thread
-        self._worker = _AnalysisWorker(self.engine, stock_data, prices)
+        self._worker = _AnalysisWorker(self.engine, self.db, stock_data, prices)
         self._worker.finished.connect(self._on_analysis_finished)
+        self._worker.saved.connect(self._on_analysis_saved)
         self._worker.error.connect(self._on_analysis_error)
         self._worker.start()
 
     def _on_analysis_finished(self, result):
         """Handle successful analysis result from worker thread."""
-        self.analyze_btn.setEnabled(True)
-        self.analyze_btn.setText("Run Complete Analysis")
-
-        # Save result to database
-        try:
-            self.db.save_analysis(result)
-            logger.info("Analysis result autosaved to database")
-        except Exception as e:
-            logger.error(f"Failed to autosave analysis: {e}")
+        self._result_cache[self._pending_key] = result
+        if len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
         # Update the dashboard with real results
         self._display_results(result)
 
+    def _on_analysis_saved(self, row_id):
+        """Handle the worker's autosave; the run is complete after this."""
+        self.analyze_btn.setEnabled(True)
+        self.analyze_btn.setText("Run Complete Analysis")
+        if row_id < 0:
+            logger.error("Failed to autosave analysis")
+            return
+        logger.info("Analysis result autosaved to database")
+        self.analysis_saved.emit()
+
     def _on_analysis_error(self, error_msg):
         """Handle analysis error from worker thread."""
         self.analyze_btn.setEnabled(True)
@@ -435,146 +491,103 @@ class CompleteAnalysisTab(QWidget):
     # ── Display results on dashboard ───────────────────────
     def _display_results(self, result):
         self.last_result = result
-        self.placeholder_label.hide()
-        self.top_frame.show()
-        self.cards_widget.show()
-        self.insights_widget.show()
-        self.actions_frame.show()
-
-        # Overall score & recommendation
-        score = result.get('overall_score', 0)
-        rec = result.get('recommendation', 'N/A')
-        conf = result.get('confidence', 'N/A')
-
-        self.score_value.setText(f"{score:.0f}")
-        self.score_value.setStyleSheet(f"font-size: 42px; font-weight: bold; color: {self._score_color(score)};")
-        self.rec_value.setText(rec)
-        self.conf_value.setText(f"{conf} Confidence")
-
-        # Fundamental score
-        fund = result.get('fundamental_analysis', {})
-        fund_score = fund.get('overall_score', 0) if fund else 0
-        self._update_card(self.fund_card, "fundamental", fund_score,
-                          fund.get('overall_rating', '') if fund else '')
-
-        # Technical score
-        tech = result.get('technical_analysis', {})
-        tech_score = tech.get('overall_score', 0) if tech else 0
-        self._update_card(self.tech_card, "technical", tech_score,
-                          tech.get('overall_signal', '') if tech else '')
-
-        # Risk score
-        risk = result.get('risk_assessment', {})
-        risk_score = risk.get('risk_score', 0) if risk else 0
-        self._update_card(self.risk_card, "risk", risk_score,
-                          risk.get('risk_level', '') if risk else '')
-
-        # Strengths
-        strengths = result.get('key_strengths', [])
-        if strengths:
-            self.strengths_label.setText("\n".join(f"• {s}" for s in strengths))
-        else:
-            self.strengths_label.setText("No specific strengths identified")
-
-        # Concerns
-        concerns = result.get('key_concerns', [])
-        if concerns:
-            self.concerns_label.setText("\n".join(f"• {c}" for c in concerns))
-        else:
-            self.concerns_label.setText("No specific concerns identified")
-
-        # Action items
-        actions = result.get('action_items', [])
-        if actions:
-            self.actions_label.setText("\n".join(f"→ {a}" for a in actions))
-        else:
-            self.actions_label.setText("No specific actions recommended")
-
-    def _update_card(self, card, prefix, score, label):
-        val_widget = card.findChild(QLabel, f"{prefix}_score_val")
-        lbl_widget = card.findChild(QLabel, f"{prefix}_score_lbl")
-        if val_widget:
-            val_widget.setText(f"{score:.0f}")
-            val_widget.setStyleSheet(f"font-size: 22px; font-weight: bold; color: {self._score_color(score)};")
-        if lbl_widget:
-            lbl_widget.setText(str(label))
+        self._ensure_results_built()
+        # Fill the whole dashboard before it repaints
+        self.results_widget.setUpdatesEnabled(False)
+        try:
+            self.placeholder_label.hide()
+            self.top_frame.show()
+            self.cards_widget.show()
+            self.insights_widget.show()
+            self.actions_frame.show()
+
+            # Overall score & recommendation
+            score = result.get('overall_score', 0)
+            rec = result.get('recommendation', 'N/A')
+            conf = result.get('confidence', 'N/A')
+
+            self.score_value.setText(f"{score:.0f}")
+            self.score_value.setStyleSheet(_SCORE_STYLE[self._score_color(score)])
+            self.rec_value.setText(rec)
+            self.conf_value.setText(f"{conf} Confidence")
+
+            # Fundamental score
+            fund = result.get('fundamental_analysis', {})
+            fund_score = fund.get('overall_score', 0) if fund else 0
+            self._update_card("fundamental", fund_score,
+                              fund.get('overall_rating', '') if fund else '')
+
+            # Technical score
+            tech = result.get('technical_analysis', {})
+            tech_score = tech.get('overall_score', 0) if tech else 0
+            self._update_card("technical", tech_score,
+                              tech.get('overall_signal', '') if tech else '')
+
+            # Risk score
+            risk = result.get('risk_assessment', {})
+            risk_score = risk.get('risk_score', 0) if risk else 0
+            self._update_card("risk", risk_score,
+                              risk.get('risk_level', '') if risk else '')
+
+            # Strengths
+            strengths = result.get('key_strengths', [])
+            if strengths:
+                self.strengths_label.setText("\n".join(f"• {s}" for s in strengths))
+            else:
+                self.strengths_label.setText("No specific strengths identified")
+
+            # Concerns
+            concerns = result.get('key_concerns', [])
+            if concerns:
+                self.concerns_label.setText("\n".join(f"• {c}" for c in concerns))
+            else:
+                self.concerns_label.setText("No specific concerns identified")
+
+            # Action items
+            actions = result.get('action_items', [])
+            if actions:
+                self.actions_label.setText("\n".join(f"→ {a}" for a in actions))
+            else:
+                self.actions_label.setText("No specific actions recommended")
+        finally:
+            self.results_widget.setUpdatesEnabled(True)
+
+    def _update_card(self, prefix, score, label):
+        _, val_widget, lbl_widget = self._card_labels[prefix]
+        val_widget.setText(f"{score:.0f}")
+        val_widget.setStyleSheet(_CARD_SCORE_STYLE[self._score_color(score)])
+        lbl_widget.setText(str(label))
 
     def _score_color(self, score):
-        if score >= 70:
-            return SUCCESS
-        if score >= 50:
-            return WARNING
+        for minimum, color in _SCORE_BANDS:
+            if score >= minimum:
+                return color
         return DANGER
 
     # ── Clear / Reset ──────────────────────────────────────
     def clear_inputs(self):
-        for attr in ("symbol_input", "price_input", "eps_input", "book_value_input",
-                      "net_income_input", "equity_input", "debt_input",
-                      "current_assets_input", "current_liabilities_input"):
+        for attr in self._INPUT_ATTRS:
             getattr(self, attr).clear()
         self.prices_input.clear()
 
         # Hide results, show placeholder
-        self.top_frame.hide()
-        self.cards_widget.hide()
-        self.insights_widget.hide()
-        self.actions_frame.hide()
+        if self.top_frame is not None:
+            self.top_frame.hide()
+            self.cards_widget.hide()
+            self.insights_widget.hide()
+            self.actions_frame.hide()
         self.placeholder_label.show()
 
     # ── Theme ──────────────────────────────────────────────
     def apply_theme(self, dark_mode: bool):
         self.is_dark = dark_mode
-        tc = _D_TEXT if dark_mode else TEXT
-        sc = TEXT_SECONDARY_DARK if dark_mode else TEXT_SECONDARY
-        card = CARD_STYLE_DARK if dark_mode else CARD_STYLE
-        bg_color = _D_BG if dark_mode else '#f1f5f9'
-        
-        # Placeholder
-        self.placeholder_label.setStyleSheet(f"color: {sc}; font-size: 13px; padding: 40px;")
-        
-        # Price hint
-        self.price_hint.setStyleSheet(f"color: {sc}; font-size: 11px;")
-        
-        # Top score/recommendation frame
-        self.top_frame.setStyleSheet(card)
-        self.score_value.setStyleSheet(f"font-size: 42px; font-weight: bold; color: {tc};")
-        self.score_title.setStyleSheet(f"font-size: 10px; font-weight: bold; color: {sc}; letter-spacing: 1px;")
-        self.rec_value.setStyleSheet(f"font-size: 28px; font-weight: bold; color: {tc};")
-        conf_bg = 'rgba(59,130,246,0.15)' if dark_mode else '#e0f2fe'
-        conf_fg = '#93c5fd' if dark_mode else TEXT
-        self.conf_value.setStyleSheet(
-            f"font-size: 12px; color: {conf_fg}; background: {conf_bg}; padding: 3px 10px; border-radius: 10px;"
-        )
-        
-        # Breakdown cards
-        for card_frame in (self.fund_card, self.tech_card, self.risk_card):
-            card_frame.setStyleSheet(card)
-            # Update card child label colors
-            for child in card_frame.findChildren(QLabel):
-                name = child.objectName()
-                if name.endswith('_card_title'):
-                    child.setStyleSheet(f"font-size: 10px; font-weight: bold; color: {sc}; letter-spacing: 1px;")
-                elif name.endswith('_score_lbl'):
-                    child.setStyleSheet(f"font-size: 11px; color: {sc};")
-                # _score_val keeps its color based on score value, leave it
-        
-        # Strengths & Concerns frames
-        self.strengths_frame.setStyleSheet(card)
-        self.concerns_frame.setStyleSheet(card)
-        self.strengths_label.setStyleSheet(f"color: {tc}; font-size: 12px; padding: 4px;")
-        self.concerns_label.setStyleSheet(f"color: {tc}; font-size: 12px; padding: 4px;")
-        
-        # Action Items frame
-        self.actions_frame.setStyleSheet(card)
-        self.act_title.setStyleSheet(f"font-weight: bold; font-size: 13px; color: {tc};")
-        self.actions_label.setStyleSheet(f"color: {tc}; font-size: 12px;")
 
     # ── Message box ────────────────────────────────────────
     def _show_msg(self, title, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(QMessageBox.Icon.Warning)
-        if self.is_dark:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        # One box reused for every message; the application stylesheet themes it
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.setIcon(QMessageBox.Icon.Warning)
+        self._msg_box.exec()
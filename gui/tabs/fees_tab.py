@@ -17,14 +17,18 @@ from gui.styles import TEXT_SECONDARY, TEXT_SECONDARY_DARK
 class FeesTab(QWidget):
     """Fee information and calculator tab."""
 
+    # Tax note HTML per theme (keyed by is_dark), formatted on first use
+    _TAX_HTML_CACHE = {}
+
     def __init__(self):
         super().__init__()
         self.fee_calculator = CSEFeeCalculator()
         self.is_dark = False
+        self._msg_box = None
         self.init_ui()
 
     def init_ui(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(14, 14, 14, 14)
 
@@ -37,13 +41,12 @@ class FeesTab(QWidget):
         content.addWidget(self._build_calculator(), 1)
         content.addWidget(self._build_info_panel(), 1)
         main_layout.addLayout(content, 1)
-        self.setLayout(main_layout)
 
     # ── calculator ────────────────────────────────────────────────────
 
     def _build_calculator(self):
         group = QGroupBox("Interactive Fee Calculator")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
@@ -89,14 +92,13 @@ class FeesTab(QWidget):
         clear_btn.clicked.connect(self.clear_inputs)
         layout.addWidget(clear_btn)
 
-        group.setLayout(layout)
         return group
 
     # ── info panel ────────────────────────────────────────────────────
 
     def _build_info_panel(self):
         group = QGroupBox("CSE Fee Structure Reference")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
@@ -130,20 +132,22 @@ class FeesTab(QWidget):
         layout.addWidget(t2)
 
         self.tax_label = QLabel()
-        self.tax_label.setWordWrap(True)
         self._update_tax_label()
         layout.addWidget(self.tax_label)
 
         layout.addStretch()
-        group.setLayout(layout)
         return group
 
     def _update_tax_label(self):
-        c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
-        self.tax_label.setText(
-            f"<b>Capital Gains Tax:</b> 30% on net profit "
-            f"<span style='color:{c};'>(Gross Profit - Total Fees)</span>"
-        )
+        html = self._TAX_HTML_CACHE.get(self.is_dark)
+        if html is None:
+            c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
+            html = (
+                f"<b>Capital Gains Tax:</b> 30% on net profit "
+                f"<span style='color:{c};'>(Gross Profit - Total Fees)</span>"
+            )
+            self._TAX_HTML_CACHE[self.is_dark] = html
+        self.tax_label.setText(html)
 
     @staticmethod
     def _make_tier_table(rows):
@@ -226,10 +230,10 @@ class FeesTab(QWidget):
         self._update_tax_label()
 
     def _show_msg(self, icon, title, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(icon)
-        if self.is_dark:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        # One box reused for every message; the application stylesheet themes it
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.setIcon(icon)
+        self._msg_box.exec()
@@ -13,7 +13,6 @@ from PyQt6.QtGui import QDoubleValidator
 from src.calculations.fundamental import FundamentalAnalyzer
 from gui.styles import (
     INFO_CARD_SUCCESS, INFO_CARD_WARNING, INFO_CARD_DANGER,
-    TEXT_SECONDARY, TEXT_SECONDARY_DARK,
     get_info_card_style
 )
 
@@ -25,6 +24,7 @@ class FundamentalTab(QWidget):
         super().__init__()
         self.analyzer = FundamentalAnalyzer()
         self.is_dark = False
+        self._msg_box = None
         # declare input attributes (set in _build_input_panel)
         self.symbol_input: QLineEdit = None  # type: ignore
         self.price_input: QLineEdit = None  # type: ignore
@@ -38,7 +38,7 @@ class FundamentalTab(QWidget):
         self.init_ui()
 
     def init_ui(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(14, 14, 14, 14)
 
@@ -65,13 +65,12 @@ class FundamentalTab(QWidget):
         self.results_panel = self._build_results_panel()
         content.addWidget(self.results_panel, 1)
         main_layout.addLayout(content, 1)
-        self.setLayout(main_layout)
 
     # ── input panel ───────────────────────────────────────────────────
 
     def _build_input_panel(self):
         group = QGroupBox("Financial Data Input")
-        grid = QGridLayout()
+        grid = QGridLayout(group)
         grid.setSpacing(7)
         grid.setContentsMargins(10, 14, 10, 10)
 
@@ -118,21 +117,20 @@ class FundamentalTab(QWidget):
         btn_widget.setLayout(btn_row)
         grid.addWidget(btn_widget, r, 0, 1, 2)
 
-        group.setLayout(grid)
         return group
 
     # ── results panel ─────────────────────────────────────────────────
 
     def _build_results_panel(self):
         group = QGroupBox("Analysis Results")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
         self.results_label = QLabel("Enter financial data and click Analyze to see results")
         self.results_label.setWordWrap(True)
         self.results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.results_label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 12px; padding: 12px;")
+        self.results_label.setProperty("role", "placeholder")
         layout.addWidget(self.results_label)
 
         self.results_table = QTableWidget()
@@ -147,7 +145,6 @@ class FundamentalTab(QWidget):
         self.results_table.hide()
         layout.addWidget(self.results_table)
 
-        group.setLayout(layout)
         return group
 
     # ── logic ─────────────────────────────────────────────────────────
@@ -232,21 +229,15 @@ class FundamentalTab(QWidget):
             getattr(self, attr).clear()
         self.results_table.hide()
         self.results_label.setText("Enter financial data and click Analyze to see results")
-        self._update_results_label_style()
-
-    def _update_results_label_style(self):
-        c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
-        self.results_label.setStyleSheet(f"color: {c}; font-size: 12px; padding: 12px;")
 
     def apply_theme(self, dark_mode: bool):
         self.is_dark = dark_mode
-        self._update_results_label_style()
 
     def _show_msg(self, icon, title, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(icon)
-        if self.is_dark:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        # One box reused for every message; the application stylesheet themes it
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.setIcon(icon)
+        self._msg_box.exec()
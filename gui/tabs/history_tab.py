@@ -8,13 +8,12 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
     QTableWidgetItem, QHeaderView, QMessageBox, QAbstractItemView, QFrame
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 from datetime import datetime
 
 from src.storage.database import AnalysisDatabase
 from gui.styles import (
-    CARD_STYLE, CARD_STYLE_DARK, TEXT, TEXT_SECONDARY,
-    TEXT_SECONDARY_DARK, SUCCESS, WARNING, DANGER,
+    CARD_STYLE, CARD_STYLE_DARK, TEXT, SUCCESS, WARNING, DANGER,
     _D_TEXT, _D_SURFACE, _D_BORDER
 )
 from src.utils.logger import get_logger
@@ -33,7 +32,7 @@ class HistoryTab(QWidget):
         self.refresh_history()
         
     def init_ui(self):
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(self)
         layout.setContentsMargins(14, 14, 14, 14)
         layout.setSpacing(10)
         
@@ -83,17 +82,18 @@ class HistoryTab(QWidget):
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)          # Recommendation
         
         self.table.itemSelectionChanged.connect(self._on_selection_changed)
-        self.table.doubleClicked.connect(self.view_details)
+        # Open the details box after the double-click has been fully delivered,
+        # not from inside the table's mouse handler
+        self.table.doubleClicked.connect(lambda: QTimer.singleShot(0, self.view_details))
         
         layout.addWidget(self.table)
         
         # Details placeholder (could be expanded later)
         self.info_lbl = QLabel("Double-click a row to view details (feature coming soon)")
-        self.info_lbl.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 11px;")
+        self.info_lbl.setTextFormat(Qt.TextFormat.PlainText)
+        self.info_lbl.setProperty("role", "caption")
         layout.addWidget(self.info_lbl)
         
-        self.setLayout(layout)
-        
     def refresh_history(self):
         """Reload history from database."""
         logger.info("Refreshing history tab")
@@ -183,6 +183,3 @@ class HistoryTab(QWidget):
     def apply_theme(self, dark_mode: bool):
         """Apply light/dark theme."""
         self.is_dark = dark_mode
-        self.info_lbl.setStyleSheet(
-            f"color: {TEXT_SECONDARY_DARK if dark_mode else TEXT_SECONDARY}; font-size: 11px;"
-        )
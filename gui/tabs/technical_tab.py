@@ -2,13 +2,15 @@
 Technical Analysis tab for CSE Stock Analyzer GUI.
 """
 
+import functools
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
     QMessageBox, QTextEdit
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QDoubleValidator
+from PyQt6.QtGui import QColor, QDoubleValidator
 
 import pyqtgraph as pg
 
@@ -16,10 +18,33 @@ from src.calculations.technical import TechnicalAnalyzer
 from gui.styles import (
     INFO_CARD_SUCCESS, INFO_CARD_WARNING, INFO_CARD_DANGER,
     INFO_CARD_SUCCESS_DARK, INFO_CARD_WARNING_DARK, INFO_CARD_DANGER_DARK,
-    TEXT_SECONDARY, TEXT_SECONDARY_DARK,
     get_info_card_style
 )
 
+# Chart colours per theme: is_dark -> role -> hex
+_PLOT_COLORS = {
+    False: {
+        "axis": "#475569", "grid": "#e2e8f0", "background": "#ffffff",
+        "price": "#2563eb", "ma20": "#16a34a", "ma50": "#d97706",
+    },
+    True: {
+        "axis": "#cbd5e1", "grid": "#334155", "background": "#0b1220",
+        "price": "#60a5fa", "ma20": "#22c55e", "ma50": "#f59e0b",
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _plot_color(is_dark: bool, role: str) -> QColor:
+    """Parse a chart colour once per theme and role."""
+    return QColor(_PLOT_COLORS[is_dark][role])
+
+
+@functools.lru_cache(maxsize=None)
+def _plot_pen(is_dark: bool, role: str, width: int = 1):
+    """Build a chart pen once; pyqtgraph copies pens it is given."""
+    return pg.mkPen(_plot_color(is_dark, role), width=width)
+
 
 class TechnicalTab(QWidget):
     """Technical analysis tab."""
@@ -28,10 +53,11 @@ class TechnicalTab(QWidget):
         super().__init__()
         self.analyzer = TechnicalAnalyzer()
         self.is_dark = False
+        self._msg_box = None
         self.init_ui()
 
     def init_ui(self):
-        main_layout = QVBoxLayout()
+        main_layout = QVBoxLayout(self)
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(14, 14, 14, 14)
 
@@ -43,11 +69,9 @@ class TechnicalTab(QWidget):
             "Enter historical prices (one per line, most recent last). "
             "Min 14 for RSI, 26 for MACD, 50 for moving averages."
         )
+        self.instructions_label.setTextFormat(Qt.TextFormat.PlainText)
         self.instructions_label.setWordWrap(True)
-        self.instructions_label.setStyleSheet(
-            f"color: {TEXT_SECONDARY}; font-size: 11px; padding: 6px 8px; "
-            "background-color: #f3f4f6; border-radius: 4px;"
-        )
+        self.instructions_label.setProperty("role", "hint")
         main_layout.addWidget(self.instructions_label)
 
         content = QHBoxLayout()
@@ -56,13 +80,12 @@ class TechnicalTab(QWidget):
         self.results_panel = self._build_results_panel()
         content.addWidget(self.results_panel, 1)
         main_layout.addLayout(content, 1)
-        self.setLayout(main_layout)
 
     # ── panels ────────────────────────────────────────────────────────
 
     def _build_input_panel(self):
         group = QGroupBox("Price Data Input")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
@@ -93,19 +116,18 @@ class TechnicalTab(QWidget):
         clear_btn.clicked.connect(self.clear_inputs)
         layout.addWidget(clear_btn)
 
-        group.setLayout(layout)
         return group
 
     def _build_results_panel(self):
         group = QGroupBox("Technical Indicators")
-        layout = QVBoxLayout()
+        layout = QVBoxLayout(group)
         layout.setSpacing(8)
         layout.setContentsMargins(10, 14, 10, 10)
 
         self.results_label = QLabel("Enter price data and click Analyze to see technical indicators")
         self.results_label.setWordWrap(True)
         self.results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.results_label.setStyleSheet(f"color: {TEXT_SECONDARY}; font-size: 12px; padding: 12px;")
+        self.results_label.setProperty("role", "placeholder")
         layout.addWidget(self.results_label)
 
         self.results_table = QTableWidget()
@@ -127,7 +149,6 @@ class TechnicalTab(QWidget):
         self.price_plot.setBackground(None)
         layout.addWidget(self.price_plot)
 
-        group.setLayout(layout)
         return group
 
     # ── sample data ───────────────────────────────────────────────────
@@ -236,50 +257,35 @@ class TechnicalTab(QWidget):
         self.price_data_input.clear()
         self.results_table.hide()
         self.results_label.setText("Enter price data and click Analyze to see technical indicators")
-        self._update_results_label_style()
         self.price_plot.clear()
 
     # ── theme ─────────────────────────────────────────────────────────
 
-    def _update_results_label_style(self):
-        c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
-        self.results_label.setStyleSheet(f"color: {c}; font-size: 12px; padding: 12px;")
-
-    def _update_instructions_style(self):
-        c = TEXT_SECONDARY_DARK if self.is_dark else TEXT_SECONDARY
-        bg = "#1f2937" if self.is_dark else "#f3f4f6"
-        self.instructions_label.setStyleSheet(
-            f"color: {c}; font-size: 11px; padding: 6px 8px; background-color: {bg}; border-radius: 4px;"
-        )
-
     def apply_theme(self, dark_mode: bool):
         self.is_dark = dark_mode
-        self._update_results_label_style()
-        self._update_instructions_style()
         self._update_plot_theme()
 
     def _show_msg(self, icon, title, text):
-        msg = QMessageBox(self)
-        msg.setWindowTitle(title)
-        msg.setText(text)
-        msg.setIcon(icon)
-        if self.is_dark:
-            msg.setStyleSheet("QLabel { color: #e2e4e7; } QMessageBox { background: #1e293b; }")
-        msg.exec()
+        # One box reused for every message; the application stylesheet themes it
+        if self._msg_box is None:
+            self._msg_box = QMessageBox(self)
+        self._msg_box.setWindowTitle(title)
+        self._msg_box.setText(text)
+        self._msg_box.setIcon(icon)
+        self._msg_box.exec()
 
     def _update_plot_theme(self):
-        ac = "#cbd5e1" if self.is_dark else "#475569"
-        gc = "#334155" if self.is_dark else "#e2e8f0"
+        axis_pen = _plot_pen(self.is_dark, "axis")
         for axis in ("left", "bottom"):
             ax = self.price_plot.getAxis(axis)
-            ax.setPen(pg.mkPen(ac))
-            ax.setTextPen(pg.mkPen(ac))
+            ax.setPen(axis_pen)
+            ax.setTextPen(axis_pen)
         self.price_plot.getPlotItem().getViewBox().setBackgroundColor(
-            "#0b1220" if self.is_dark else "#ffffff"
+            _plot_color(self.is_dark, "background")
         )
         self.price_plot.getPlotItem().setMenuEnabled(False)
         self.price_plot.showGrid(x=True, y=True, alpha=0.25)
-        self.price_plot.getPlotItem().getViewBox().setBorder(pg.mkPen(gc))
+        self.price_plot.getPlotItem().getViewBox().setBorder(_plot_pen(self.is_dark, "grid"))
 
     # ── chart ─────────────────────────────────────────────────────────
 
@@ -289,16 +295,15 @@ class TechnicalTab(QWidget):
         if not prices:
             return
         x = list(range(1, len(prices) + 1))
-        pc = "#60a5fa" if self.is_dark else "#2563eb"
-        mc = "#22c55e" if self.is_dark else "#16a34a"
-        fc = "#f59e0b" if self.is_dark else "#d97706"
-        self.price_plot.plot(x, prices, pen=pg.mkPen(pc, width=2), name="Price")
-        for series_key, color, label in [("ma20", mc, "MA 20"), ("ma50", fc, "MA 50")]:
+        self.price_plot.plot(x, prices, pen=_plot_pen(self.is_dark, "price", 2), name="Price")
+        for series_key, label in (("ma20", "MA 20"), ("ma50", "MA 50")):
             series = plot_data.get(series_key)
             if series:
                 xs, ys = self._series_points(series)
                 if xs:
-                    self.price_plot.plot(xs, ys, pen=pg.mkPen(color, width=2), name=label)
+                    self.price_plot.plot(
+                        xs, ys, pen=_plot_pen(self.is_dark, series_key, 2), name=label
+                    )
         self.price_plot.setLabel("bottom", "Data Points")
         self.price_plot.setLabel("left", "Price (LKR)")
 
@@ -13,7 +13,6 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 
 from gui.main_window import MainWindow
-from gui.styles import GLOBAL_STYLESHEET
 from src.utils.logger import setup_logging, get_logger
 
 # Initialize logger
@@ -42,10 +41,7 @@ def main():
     # Set modern Fusion style (cross-platform)
     app.setStyle('Fusion')
     
-    # Apply global stylesheet
-    app.setStyleSheet(GLOBAL_STYLESHEET)
-    
-    # Create and show main window
+    # Create and show main window (installs the global stylesheet)
     window = MainWindow()
     window.show()
     
@@ -0,0 +1,36 @@
+"""
+Icon render script — writes the toolbar, menu and tab icons used by
+gui/main_window.py to gui/resources/icons/ as PNGs.
+Re-run after adding or changing an icon with: python render_icons.py
+
+MainWindow loads these files directly and only falls back to qtawesome
+(which has to load its icon font and rasterize each glyph) when one is missing.
+"""
+import sys
+import os
+import re
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from PyQt6.QtWidgets import QApplication
+
+import qtawesome as qta
+
+from gui.main_window import ICON_COLOR, ICON_DIR
+
+# Rendered large enough to stay sharp when Qt scales down for 2x displays
+ICON_SIZE = 64
+
+app = QApplication(sys.argv)
+
+with open(os.path.join(os.path.dirname(__file__), "gui", "main_window.py"), encoding="utf-8") as f:
+    names = sorted(set(re.findall(r'"(fa5[sbr]\.[\w-]+)"', f.read())))
+
+os.makedirs(ICON_DIR, exist_ok=True)
+for name in names:
+    path = os.path.join(ICON_DIR, f"{name}.png")
+    qta.icon(name, color=ICON_COLOR).pixmap(ICON_SIZE, ICON_SIZE).save(path)
+    print(f"Saved: {path}")
+
+print(f"Rendered {len(names)} icons.")
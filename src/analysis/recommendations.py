@@ -197,7 +197,7 @@ class RecommendationEngine:
         fundamental_score = fundamental_result['overall_score']
         
         # Perform technical analysis (if price data provided)
-        if prices and len(prices) > 0:
+        if prices is not None and len(prices) > 0:
             technical_result = self.technical_analyzer.comprehensive_analysis(prices, volumes)
             recommendation['technical_analysis'] = technical_result
             technical_score = technical_result['overall_score']
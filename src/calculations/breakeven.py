@@ -5,6 +5,8 @@ This module calculates the minimum selling price needed to break even
 after accounting for all CSE trading fees and taxes.
 """
 
+import numpy as np
+
 from src.fees.cse_fees import CSEFeeCalculator
 from src.utils.helpers import validate_positive_number
 from typing import Any, Dict, Optional
@@ -27,6 +29,25 @@ class BreakEvenCalculator:
         self.fee_calculator = CSEFeeCalculator(custom_config)
         self.config = self.fee_calculator.config
     
+    def _sell_fee_rate(self, transaction_value: float) -> float:
+        """
+        Get the combined selling fee rate (including STL tax) for a transaction.
+        
+        Args:
+            transaction_value: Transaction value used to pick the fee tier
+        
+        Returns:
+            float: Sum of all sell-side fee rates
+        """
+        rates = self.fee_calculator._get_fee_rates(transaction_value)
+        return (
+            rates['broker_commission'] +
+            rates['sec_fee'] +
+            rates['cse_fee'] +
+            rates['cds_fee'] +
+            rates['stl_tax']
+        )
+    
     def calculate_breakeven_price(self, buy_price: float, quantity: float, include_tax: bool = True) -> Dict[str, Any]:
         """
         Calculate the minimum selling price to break even.
@@ -55,17 +76,8 @@ class BreakEvenCalculator:
         # To break even, we need: net_proceeds_from_sale >= total_investment
         # If including tax: net_proceeds_after_tax >= total_investment
         
-        # Get fee rates for selling (use buy_value as reference for tier determination)
-        rates = self.fee_calculator._get_fee_rates(buy_value)
-        
-        # Selling fee rate (excluding STL which is already in the rate)
-        sell_fee_rate = (
-            rates['broker_commission'] +
-            rates['sec_fee'] +
-            rates['cse_fee'] +
-            rates['cds_fee'] +
-            rates['stl_tax']
-        )
+        # Selling fee rate (use buy_value as reference for tier determination)
+        sell_fee_rate = self._sell_fee_rate(buy_value)
         
         # Validate that fee rate is not 100% or higher (would make break-even impossible)
         if sell_fee_rate >= 1.0:
@@ -192,14 +204,7 @@ class BreakEvenCalculator:
         
         # Calculate sell price needed to get this net proceeds
         # Working backwards from net_proceeds
-        rates = self.fee_calculator._get_fee_rates(required_net_proceeds)
-        sell_fee_rate = (
-            rates['broker_commission'] +
-            rates['sec_fee'] +
-            rates['cse_fee'] +
-            rates['cds_fee'] +
-            rates['stl_tax']
-        )
+        sell_fee_rate = self._sell_fee_rate(required_net_proceeds)
         
         target_sell_price = required_net_proceeds / (quantity * (1 - sell_fee_rate))
         
@@ -285,6 +290,56 @@ class BreakEvenCalculator:
             'includes_capital_gains_tax': include_tax
         }
 
+    def calculate_profit_curve(self, buy_price: float, quantity: float, include_tax: bool,
+                               sell_prices: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate profit/loss across many selling prices in one vectorized pass.
+        
+        Matches calculate_profit_at_price point for point, including the fee
+        tier and minimum commission applied to each sell value.
+        
+        Args:
+            buy_price: Original purchase price per share
+            quantity: Number of shares
+            include_tax: Whether to include capital gains tax
+            sell_prices: Array of proposed selling prices per share
+        
+        Returns:
+            dict: Arrays of sell fees, gross/net profit, tax and return per price
+        """
+        validate_positive_number(buy_price, "Buy price")
+        validate_positive_number(quantity, "Quantity")
+        sell_prices = np.asarray(sell_prices, dtype=float)
+        if sell_prices.size and sell_prices.min() <= 0:
+            raise ValueError("Sell prices must be positive")
+        
+        total_investment = self.fee_calculator.calculate_buy_fees(buy_price * quantity, quantity)['total_cost']
+        
+        # Per-point fee rates: each sell value picks its own tier
+        fees = self.config['cse_fees']
+        sell_values = sell_prices * quantity
+        in_tier_1 = sell_values <= fees['tier_1']['max_value']
+        
+        def rate(name):
+            return np.where(in_tier_1, fees['tier_1'][name], fees['tier_2'][name])
+        
+        commission = np.maximum(sell_values * rate('broker_commission'), fees['minimum_commission'])
+        sell_fees = commission + sell_values * (
+            rate('sec_fee') + rate('cse_fee') + rate('cds_fee') + rate('stl_tax')
+        )
+        gross_profit = sell_values - sell_fees - total_investment
+        tax = np.where(gross_profit > 0, gross_profit * self.config['taxes']['capital_gains_tax'], 0.0)
+        net_profit = gross_profit - tax if include_tax else gross_profit
+        
+        return {
+            'sell_price': sell_prices,
+            'sell_fees': sell_fees,
+            'gross_profit': gross_profit,
+            'capital_gains_tax': tax,
+            'net_profit': net_profit,
+            'profit_percentage': net_profit / total_investment,
+        }
+
 
 def calculate_breakeven(buy_price, quantity, include_tax=True, custom_config=None):
     """
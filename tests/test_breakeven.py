@@ -1,5 +1,6 @@
 """Tests for src.calculations.breakeven module."""
 
+import numpy as np
 import pytest
 from src.calculations.breakeven import BreakEvenCalculator, calculate_breakeven
 
@@ -102,6 +103,30 @@ class TestBreakEvenCalculator:
         for key in expected:
             assert key in result
 
+    # ── Profit curve ────────────────────────────────────────
+
+    @pytest.mark.parametrize("include_tax", [True, False])
+    def test_profit_curve_matches_scalar(self, include_tax):
+        # Spans the minimum-commission floor and both fee tiers
+        prices = np.array([1.0, 50.0, 90.0, 100.0, 120.0, 150_000.0])
+        curve = self.calc.calculate_profit_curve(100, 1000, include_tax, prices)
+        for i, price in enumerate(prices):
+            scalar = self.calc.calculate_profit_at_price(100, float(price), 1000, include_tax)
+            assert curve['net_profit'][i] == pytest.approx(scalar['net_profit'])
+            assert curve['gross_profit'][i] == pytest.approx(scalar['gross_profit'])
+            assert curve['profit_percentage'][i] == pytest.approx(scalar['profit_percentage'])
+
+    def test_profit_curve_crosses_zero_at_breakeven(self):
+        breakeven = self.calc.calculate_breakeven_price(100, 1000)['breakeven_price']
+        curve = self.calc.calculate_profit_curve(100, 1000, True, np.linspace(50, 150, 256))
+        below = curve['sell_price'] < breakeven - 0.01
+        assert (curve['net_profit'][below] < 0).all()
+        assert (curve['net_profit'][~below] > -1).all()
+
+    def test_profit_curve_rejects_non_positive_prices(self):
+        with pytest.raises(ValueError):
+            self.calc.calculate_profit_curve(100, 1000, True, np.array([10.0, 0.0]))
+
     # ── Validation ──────────────────────────────────────────
 
     def test_invalid_buy_price(self):
@@ -1,5 +1,6 @@
 """Tests for src.analysis.recommendations module."""
 
+import numpy as np
 import pytest
 from src.analysis.recommendations import RecommendationEngine
 
@@ -44,6 +45,16 @@ class TestRecommendationEngine:
         assert result['technical_analysis'] is not None
         assert result['technical_analysis']['overall_score'] >= 0
 
+    def test_recommendation_with_price_array(self, sample_stock_data, sample_prices):
+        from_list = self.engine.generate_recommendation(sample_stock_data, prices=sample_prices)
+        from_array = self.engine.generate_recommendation(sample_stock_data, prices=np.array(sample_prices))
+        assert from_array['technical_analysis'] == from_list['technical_analysis']
+        assert from_array['overall_score'] == from_list['overall_score']
+
+    def test_recommendation_with_empty_price_array(self, sample_stock_data):
+        result = self.engine.generate_recommendation(sample_stock_data, prices=np.array([]))
+        assert result['technical_analysis']['overall_signal'] == 'NEUTRAL'
+
     def test_recommendation_has_breakdown(self, sample_stock_data, sample_prices):
         result = self.engine.generate_recommendation(sample_stock_data, prices=sample_prices)
         assert 'fundamental_analysis' in result